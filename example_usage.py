@@ -7,8 +7,9 @@ and interact with the Factory.8090.ai service.
 """
 
 import asyncio
-import json
-from factory_client import Factory8090Client
+
+import fastjson
+from factory_client import Factory8090Client, shutdown_shared_browser
 
 
 async def explore_service():
@@ -50,24 +51,50 @@ async def explore_service():
         # Step 4: Generate integration report
         print("\n📊 Step 4: Generating integration report...")
         report = {
-            "service_discovery": service_info.dict(),
+            "service_discovery": client._last_service_info_dict,
             "page_analysis": page_data,
             "api_testing": api_results if service_info.api_endpoints else {},
             "recommendations": generate_recommendations(service_info, page_data)
         }
         
         # Save report to file
-        with open("factory_8090_integration_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+        fastjson.dump_file(report, "factory_8090_integration_report.json", pretty=True)
             
         print("📁 Integration report saved to: factory_8090_integration_report.json")
         
         return report
 
 
+# Recommendations that apply to every integration; generate_recommendations returns copies
+_STATIC_RECS = (
+    {
+        "type": "error_handling",
+        "priority": "high",
+        "description": "Implement robust error handling and retry mechanisms.",
+        "action": "Add exponential backoff and comprehensive error logging"
+    },
+    {
+        "type": "monitoring",
+        "priority": "medium",
+        "description": "Set up monitoring and alerting for the integration.",
+        "action": "Implement metrics collection and alerting system"
+    },
+    {
+        "type": "security",
+        "priority": "high",
+        "description": "Ensure secure credential management and data handling.",
+        "action": "Implement secure authentication and data encryption"
+    },
+)
+
+
 def generate_recommendations(service_info, page_data):
     """Generate integration recommendations based on discovered information"""
     recommendations = []
+    elements = page_data['elements']
+    forms = elements['forms']
+    buttons = elements['buttons']
+    status = service_info.status
     
     # Analyze service capabilities
     if not service_info.api_endpoints:
@@ -79,52 +106,33 @@ def generate_recommendations(service_info, page_data):
         })
     
     # Analyze page structure
-    if page_data['elements']['forms'] > 0:
+    if forms > 0:
         recommendations.append({
             "type": "form_automation",
             "priority": "medium",
-            "description": f"Found {page_data['elements']['forms']} forms. Consider form automation.",
+            "description": f"Found {forms} forms. Consider form automation.",
             "action": "Implement form filling and submission automation"
         })
     
-    if page_data['elements']['buttons'] > 0:
+    if buttons > 0:
         recommendations.append({
             "type": "ui_automation",
             "priority": "medium",
-            "description": f"Found {page_data['elements']['buttons']} buttons. Consider UI automation.",
+            "description": f"Found {buttons} buttons. Consider UI automation.",
             "action": "Implement button clicking and UI interaction automation"
         })
     
     # Service health recommendations
-    if service_info.status != "healthy":
+    if status != "healthy":
         recommendations.append({
             "type": "health_monitoring",
             "priority": "high",
-            "description": f"Service status is {service_info.status}. Implement health monitoring.",
+            "description": f"Service status is {status}. Implement health monitoring.",
             "action": "Set up regular health checks and alerting"
         })
     
-    # General recommendations
-    recommendations.extend([
-        {
-            "type": "error_handling",
-            "priority": "high",
-            "description": "Implement robust error handling and retry mechanisms.",
-            "action": "Add exponential backoff and comprehensive error logging"
-        },
-        {
-            "type": "monitoring",
-            "priority": "medium",
-            "description": "Set up monitoring and alerting for the integration.",
-            "action": "Implement metrics collection and alerting system"
-        },
-        {
-            "type": "security",
-            "priority": "high",
-            "description": "Ensure secure credential management and data handling.",
-            "action": "Implement secure authentication and data encryption"
-        }
-    ])
+    # General recommendations, copied so callers can edit them without touching the templates
+    recommendations.extend(dict(rec) for rec in _STATIC_RECS)
     
     return recommendations
 
@@ -152,6 +160,8 @@ async def main():
         print(f"❌ Error during exploration: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await shutdown_shared_browser()
 
 
 if __name__ == "__main__":
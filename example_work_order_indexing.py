@@ -51,25 +51,22 @@ async def demonstrate_work_order_indexing():
         search_queries = ["urgent", "task", "bug", "feature"]
         
         for query in search_queries:
-            results = indexer.search_work_orders(query)
+            results = indexer.search_work_order_ids(query)
             print(f"Search '{query}': {len(results)} results")
         
         # Step 4: Show statistics
         print("\n📊 Step 4: Work order statistics...")
         stats = indexer.get_work_order_statistics()
         
-        print(f"Total work orders: {stats['total_work_orders']}")
-        print(f"Last indexed: {stats['last_index_time'] or 'Never'}")
-        
-        print("\nStatus distribution:")
-        for status, count in stats['status_distribution'].items():
-            if count > 0:
-                print(f"  {status}: {count}")
-        
-        print("\nPriority distribution:")
-        for priority, count in stats['priority_distribution'].items():
-            if count > 0:
-                print(f"  {priority}: {count}")
+        lines = [
+            f"Total work orders: {stats['total_work_orders']}",
+            f"Last indexed: {stats['last_index_time'] or 'Never'}",
+            "\nStatus distribution:",
+        ]
+        lines.extend(f"  {status}: {count}" for status, count in stats['status_distribution'].items() if count > 0)
+        lines.append("\nPriority distribution:")
+        lines.extend(f"  {priority}: {count}" for priority, count in stats['priority_distribution'].items() if count > 0)
+        print("\n".join(lines))
         
         # Step 5: Export work orders
         print("\n💾 Step 5: Exporting work orders...")
@@ -81,18 +78,17 @@ async def demonstrate_work_order_indexing():
         print("\n🔍 Step 6: Filtering work orders...")
         
         # Filter by status
-        in_progress_orders = indexer.index.get_work_orders_by_status(WorkOrderStatus.IN_PROGRESS)
-        print(f"In progress work orders: {len(in_progress_orders)}")
+        in_progress_count = indexer.index.count_work_orders_by_status(WorkOrderStatus.IN_PROGRESS)
+        print(f"In progress work orders: {in_progress_count}")
         
         # Filter by priority
-        high_priority_orders = indexer.index.get_work_orders_by_priority(WorkOrderPriority.HIGH)
-        print(f"High priority work orders: {len(high_priority_orders)}")
+        high_priority_count = indexer.index.count_work_orders_by_priority(WorkOrderPriority.HIGH)
+        print(f"High priority work orders: {high_priority_count}")
         
         # Filter by tags
         if stats['tags_count'] > 0:
-            all_tags = list(indexer.index.index_by_tags.keys())
-            if all_tags:
-                tag = all_tags[0]
+            tag = next(iter(indexer.index.index_by_tags), None)
+            if tag is not None:
                 tagged_orders = indexer.index.get_work_orders_by_tag(tag)
                 print(f"Work orders with tag '{tag}': {len(tagged_orders)}")
         
@@ -112,7 +108,8 @@ def demonstrate_manual_work_order_creation():
     # Create a new indexer
     indexer = WorkOrderIndexer()
     
-    # Create some sample work orders
+    # Create some sample work orders, all stamped with the same creation time
+    now = datetime.now()
     sample_work_orders = [
         WorkOrder(
             id="wo_001",
@@ -120,8 +117,8 @@ def demonstrate_manual_work_order_creation():
             description="Users are unable to log in with special characters in passwords",
             status=WorkOrderStatus.QUEUED,
             priority=WorkOrderPriority.HIGH,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             assigned_to="developer@company.com",
             tags=["bug", "authentication", "urgent"],
             metadata={"component": "auth", "version": "2.1.0"}
@@ -132,8 +129,8 @@ def demonstrate_manual_work_order_creation():
             description="Add a new analytics dashboard for user metrics",
             status=WorkOrderStatus.IN_PROGRESS,
             priority=WorkOrderPriority.MEDIUM,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             assigned_to="frontend@company.com",
             tags=["feature", "dashboard", "analytics"],
             metadata={"component": "frontend", "version": "2.2.0"}
@@ -144,8 +141,8 @@ def demonstrate_manual_work_order_creation():
             description="Update API documentation for new endpoints",
             status=WorkOrderStatus.QUEUED,
             priority=WorkOrderPriority.LOW,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             assigned_to="docs@company.com",
             tags=["documentation", "api"],
             metadata={"component": "docs", "version": "2.1.0"}
@@ -153,8 +150,8 @@ def demonstrate_manual_work_order_creation():
     ]
     
     # Add work orders to index
+    indexer.index.add_work_orders(sample_work_orders)
     for wo in sample_work_orders:
-        indexer.index.add_work_order(wo)
         print(f"✅ Added work order: {wo.title}")
     
     # Show statistics
@@ -8,16 +8,22 @@ It includes both browser automation and potential API client functionality.
 
 import asyncio
 import json
-import logging
-import time
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin
+import re
+import threading
+import weakref
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlsplit
 
 import httpx
 import structlog
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from pydantic import BaseModel, Field
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -39,6 +45,149 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Patterns used to discover API endpoints and capabilities in page content
+_API_RE = re.compile(r'["\']([^"\']*(?:api|endpoint|service)[^"\']*)["\']', re.IGNORECASE)
+_CAP_RE = re.compile(r'["\']([^"\']*(?:capability|feature|function)[^"\']*)["\']', re.IGNORECASE)
+
+# HTTP methods tried, in order, when testing discovered endpoints
+PROBE_METHODS = ("GET", "POST", "PUT", "DELETE")
+
+# Upper bound on in-flight endpoint probes
+MAX_CONCURRENT_PROBES = 32
+
+# Page summary gathered by extract_page_data in one evaluate call
+_PAGE_SUMMARY_JS = """() => ({
+    title: document.title,
+    buttons: document.querySelectorAll('button').length,
+    inputs: document.querySelectorAll('input').length,
+    forms: document.querySelectorAll('form').length,
+    text: document.body.innerText.slice(0, 1000),
+})"""
+
+_API_ID = 0
+_CAP_ID = 1
+
+
+def _build_hyperscan_db():
+    """Compile the discovery patterns into a single Hyperscan database"""
+    if hyperscan is None:
+        return None
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[
+            rb'["\'][^"\']*(?:api|endpoint|service)[^"\']*["\']',
+            rb'["\'][^"\']*(?:capability|feature|function)[^"\']*["\']',
+        ],
+        ids=[_API_ID, _CAP_ID],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+    )
+    return db
+
+
+_HS_DB = _build_hyperscan_db()
+
+# A Hyperscan scratch space serves one scan at a time, and scans run in worker
+# threads via asyncio.to_thread, so every thread allocates its own
+_hs_local = threading.local()
+
+
+def _hs_scratch():
+    """Get this thread's Hyperscan scratch space for _HS_DB"""
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    return scratch
+
+
+def _scan_content(content: str) -> Tuple[List[str], List[str]]:
+    """
+    Scan page content for API endpoints and capabilities.
+    
+    Uses a single Hyperscan pass when available, otherwise the compiled
+    regular expressions.
+    
+    Returns:
+        Tuple of deduplicated (api_endpoints, capabilities), in first-seen order
+    """
+    if _HS_DB is None:
+        return (list(dict.fromkeys(_API_RE.findall(content))),
+                list(dict.fromkeys(_CAP_RE.findall(content))))
+    
+    data = content.encode("utf-8")
+    found: Dict[int, Dict[str, None]] = {_API_ID: {}, _CAP_ID: {}}
+    last_end = {_API_ID: -1, _CAP_ID: -1}
+    
+    def on_match(match_id, start, end, flags, context):
+        # Hyperscan reports overlapping matches; keep the non-overlapping
+        # leftmost ones so results agree with re.findall
+        if start < last_end[match_id]:
+            return None
+        last_end[match_id] = end
+        found[match_id][data[start + 1:end - 1].decode("utf-8", errors="ignore")] = None
+        return None
+    
+    _HS_DB.scan(data, match_event_handler=on_match, scratch=_hs_scratch())
+    return list(found[_API_ID]), list(found[_CAP_ID])
+
+
+# Playwright and Chromium are launched once per event loop and shared by all clients
+# on it; each client only opens its own lightweight browser context
+class _SharedBrowser:
+    """Playwright state bound to one event loop"""
+    
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+
+
+# Playwright objects and asyncio locks only work on the loop that created them, so a
+# later asyncio.run() gets fresh state instead of reusing objects from a closed loop
+_shared_browsers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedBrowser]" = weakref.WeakKeyDictionary()
+
+
+def _shared_state() -> _SharedBrowser:
+    """Get the shared Playwright state for the running event loop"""
+    loop = asyncio.get_running_loop()
+    state = _shared_browsers.get(loop)
+    if state is None:
+        state = _shared_browsers[loop] = _SharedBrowser()
+    return state
+
+
+async def _get_shared_browser() -> Browser:
+    """Get the shared browser for the running event loop, launching it on first use"""
+    state = _shared_state()
+    
+    async with state.lock:
+        if state.browser is None or not state.browser.is_connected():
+            if state.playwright is None:
+                state.playwright = await async_playwright().start()
+            state.browser = await state.playwright.chromium.launch(headless=True)
+            
+    return state.browser
+
+
+async def shutdown_shared_browser() -> None:
+    """Close the running loop's shared browser and stop Playwright; call before the loop ends"""
+    state = _shared_state()
+    
+    async with state.lock:
+        if state.browser is not None:
+            await state.browser.close()
+            state.browser = None
+        if state.playwright is not None:
+            await state.playwright.stop()
+            state.playwright = None
+
+
+def _endpoint_key(endpoint: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Normalize an endpoint so the same URL written differently is probed once"""
+    parts = urlsplit(endpoint)
+    query = tuple(sorted(param for param in parts.query.split("&") if param))
+    return parts.netloc.lower(), parts.path or "/", query
+
 
 class FactoryServiceInfo(BaseModel):
     """Model for factory service information"""
@@ -61,7 +210,10 @@ class Factory8090Client:
         self.timeout = timeout
         self.session: Optional[httpx.AsyncClient] = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._last_content_len: Optional[int] = None
+        self._last_service_info_dict: Optional[Dict[str, Any]] = None
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -80,6 +232,11 @@ class Factory8090Client:
         self.session = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_CONCURRENT_PROBES,
+                max_connections=MAX_CONCURRENT_PROBES * 2
+            ),
             headers={
                 "User-Agent": "Factory.8090.ai Integration Client/1.0",
                 "Accept": "application/json, text/html, */*",
@@ -87,9 +244,9 @@ class Factory8090Client:
         )
         
         # Initialize browser automation
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
-        self.page = await self.browser.new_page()
+        self.browser = await _get_shared_browser()
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
         
         # Set up request interception to capture API calls
         await self._setup_request_interception()
@@ -103,8 +260,9 @@ class Factory8090Client:
         if self.session:
             await self.session.aclose()
             
-        if self.browser:
-            await self.browser.close()
+        # The browser itself is shared; only this client's context is closed
+        if self.context:
+            await self.context.close()
             
         logger.info("Client closed")
         
@@ -126,13 +284,18 @@ class Factory8090Client:
                           status=response.status,
                           content_type=response.headers.get("content-type"))
                 
-        await self.page.route("**/*", handle_request)
-        await self.page.on("response", handle_response)
+        # Passive listeners: unlike page.route, these do not hold up each request
+        self.page.on("request", handle_request)
+        self.page.on("response", handle_response)
         
-    async def discover_service_info(self) -> FactoryServiceInfo:
+    async def discover_service_info(self, deep_scan: bool = False) -> FactoryServiceInfo:
         """
         Discover service information through browser automation and network analysis.
         
+        Args:
+            deep_scan: Also wait for the network to go idle so configuration
+                injected by late-running JavaScript is included in the scan
+        
         Returns:
             FactoryServiceInfo: Discovered service information
         """
@@ -141,57 +304,61 @@ class Factory8090Client:
         if not self.page:
             raise RuntimeError("Client not initialized. Call initialize() first.")
             
-        # Navigate to the service
-        await self.page.goto(self.base_url)
-        await self.page.wait_for_load_state("networkidle")
-        
-        # Extract basic information from the page
-        title = await self.page.title()
-        logger.info("Page title", title=title)
-        
-        # Look for any API endpoints or service information
-        api_endpoints = []
-        capabilities = []
-        
-        # Check for common API patterns in the page source
-        content = await self.page.content()
-        
-        # Look for API endpoints in JavaScript or configuration
-        import re
-        api_patterns = [
-            r'["\']([^"\']*api[^"\']*)["\']',
-            r'["\']([^"\']*endpoint[^"\']*)["\']',
-            r'["\']([^"\']*service[^"\']*)["\']',
-        ]
-        
-        for pattern in api_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            api_endpoints.extend(matches)
+        # Check service health while the browser loads the page
+        health_task = asyncio.create_task(self._check_health())
+        
+        try:
+            # Navigate to the service
+            self._invalidate_content_cache()
+            await self.page.goto(self.base_url, wait_until="domcontentloaded",
+                                 timeout=self.timeout * 1000)
+            if deep_scan:
+                await self.page.wait_for_load_state("networkidle")
+            
+            # Extract basic information from the page
+            title = await self.page.title()
+            logger.info("Page title", title=title)
+            
+            # Check for common API patterns in the page source
+            content = await self.page.content()
+            self._last_content_len = len(content)
             
-        # Look for service capabilities
-        capability_patterns = [
-            r'["\']([^"\']*capability[^"\']*)["\']',
-            r'["\']([^"\']*feature[^"\']*)["\']',
-            r'["\']([^"\']*function[^"\']*)["\']',
-        ]
-        
-        for pattern in capability_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            capabilities.extend(matches)
+            # Look for API endpoints and service capabilities in JavaScript or configuration
+            # Scan in a worker thread so large pages do not block the event loop
+            api_endpoints, capabilities = await asyncio.to_thread(_scan_content, content)
+        except BaseException:
+            health_task.cancel()
+            raise
             
-        # Check service health
-        health_status = await self._check_health()
+        # Collect the service health result
+        health_status = await health_task
         
         service_info = FactoryServiceInfo(
             name="8090 Software Factory",
             status=health_status,
-            capabilities=list(set(capabilities)),
-            api_endpoints=list(set(api_endpoints))
+            capabilities=capabilities,
+            api_endpoints=api_endpoints
         )
         
-        logger.info("Service discovery completed", service_info=service_info.dict())
+        service_info_dict = service_info.dict()
+        self._last_service_info_dict = service_info_dict
+        logger.info("Service discovery completed", service_info=service_info_dict)
         return service_info
         
+    def _invalidate_content_cache(self) -> None:
+        """Drop the cached page content length; call before navigating the page"""
+        self._last_content_len = None
+        
+    async def _get_content_length(self) -> int:
+        """Get the current page content length, reusing the cached length if available"""
+        if self._last_content_len is None:
+            # Only the length is needed here, so measure it in the page
+            # rather than shipping the full HTML across
+            self._last_content_len = await self.page.evaluate(
+                "() => document.documentElement.outerHTML.length"
+            )
+        return self._last_content_len
+        
     async def _check_health(self) -> str:
         """Check service health status"""
         try:
@@ -223,40 +390,88 @@ class Factory8090Client:
             logger.warning("No HTTP session available for API testing")
             return results
             
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        
+        async def _probe(method: str, endpoint: str) -> Optional[httpx.Response]:
+            """Issue a single probe request, returning None on failure"""
+            async with semaphore:
+                try:
+                    return await self.session.request(method, endpoint)
+                except Exception as e:
+                    logger.debug("API call failed", 
+                               method=method, 
+                               endpoint=endpoint, 
+                               error=str(e))
+                    return None
+        
+        # Skip endpoints that normalize to one already queued for probing
+        seen = set()
+        unique_endpoints = []
         for endpoint in endpoints:
-            try:
-                logger.info("Testing endpoint", endpoint=endpoint)
+            key = _endpoint_key(endpoint)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_endpoints.append(endpoint)
+            logger.info("Testing endpoint", endpoint=endpoint)
+        
+        endpoint_results: Dict[str, Dict[str, Any]] = {endpoint: {} for endpoint in unique_endpoints}
+        pending = list(endpoint_results)
+        
+        # Ask every endpoint which methods it supports so only those are probed
+        options_responses = await asyncio.gather(*[_probe("OPTIONS", endpoint) for endpoint in pending])
+        allowed_methods = {
+            endpoint: self._parse_allowed_methods(response)
+            for endpoint, response in zip(pending, options_responses)
+        }
+        
+        # Probe one method at a time across all endpoints concurrently, only
+        # moving on to the next method for endpoints that have not answered 200
+        for method in PROBE_METHODS:
+            if not pending:
+                break
+                
+            candidates = [endpoint for endpoint in pending if method in allowed_methods[endpoint]]
+            responses = await asyncio.gather(*[_probe(method, endpoint) for endpoint in candidates])
+            succeeded = set()
+            
+            for endpoint, response in zip(candidates, responses):
+                if response is None:
+                    continue
+                    
+                endpoint_results[endpoint][f"{method} {endpoint}"] = {
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content_type": response.headers.get("content-type"),
+                    "success": 200 <= response.status_code < 300
+                }
                 
-                # Try different HTTP methods
-                for method in ["GET", "POST", "PUT", "DELETE"]:
-                    try:
-                        response = await self.session.request(method, endpoint)
-                        results[f"{method} {endpoint}"] = {
-                            "status_code": response.status_code,
-                            "headers": dict(response.headers),
-                            "content_type": response.headers.get("content-type"),
-                            "success": 200 <= response.status_code < 300
-                        }
-                        
-                        if response.status_code == 200:
-                            logger.info("Successful API call", 
-                                      method=method, 
-                                      endpoint=endpoint,
-                                      status=response.status_code)
-                            break
-                            
-                    except Exception as e:
-                        logger.debug("API call failed", 
-                                   method=method, 
-                                   endpoint=endpoint, 
-                                   error=str(e))
-                        
-            except Exception as e:
-                logger.error("Endpoint test failed", endpoint=endpoint, error=str(e))
-                results[endpoint] = {"error": str(e)}
+                if response.status_code == 200:
+                    logger.info("Successful API call", 
+                              method=method, 
+                              endpoint=endpoint,
+                              status=response.status_code)
+                    succeeded.add(endpoint)
+                    
+            pending = [endpoint for endpoint in pending if endpoint not in succeeded]
+            
+        for endpoint_result in endpoint_results.values():
+            results.update(endpoint_result)
                 
         return results
         
+    @staticmethod
+    def _parse_allowed_methods(response: Optional[httpx.Response]) -> set:
+        """Get the methods advertised by an OPTIONS response, defaulting to GET"""
+        if response is None or response.status_code == 405:
+            return {"GET"}
+            
+        allow = response.headers.get("allow")
+        if not allow:
+            return {"GET"}
+            
+        return {method.strip().upper() for method in allow.split(",")}
+        
     async def extract_page_data(self) -> Dict[str, Any]:
         """
         Extract data from the current page.
@@ -268,31 +483,30 @@ class Factory8090Client:
             raise RuntimeError("No page available")
             
         data = {
-            "title": await self.page.title(),
+            "title": "",
             "url": self.page.url,
-            "content_length": len(await self.page.content()),
+            "content_length": await self._get_content_length(),
             "elements": {}
         }
         
         # Extract specific elements
         try:
-            # Look for common UI elements
-            buttons = await self.page.query_selector_all("button")
-            inputs = await self.page.query_selector_all("input")
-            forms = await self.page.query_selector_all("form")
+            # Collect title, common UI element counts and text content in a single round-trip
+            page_summary = await self.page.evaluate(_PAGE_SUMMARY_JS)
             
+            data["title"] = page_summary["title"]
             data["elements"] = {
-                "buttons": len(buttons),
-                "inputs": len(inputs),
-                "forms": len(forms)
+                "buttons": page_summary["buttons"],
+                "inputs": page_summary["inputs"],
+                "forms": page_summary["forms"]
             }
-            
-            # Extract text content
-            body_text = await self.page.evaluate("document.body.innerText")
-            data["text_content"] = body_text[:1000]  # First 1000 characters
+            data["text_content"] = page_summary["text"]  # First 1000 characters
             
         except Exception as e:
             logger.error("Failed to extract page data", error=str(e))
+            # The summary script failing (e.g. a page without a body) must not cost the title
+            if not data["title"]:
+                data["title"] = await self.page.title()
             
         return data
 
@@ -301,21 +515,24 @@ async def main():
     """Main function to demonstrate the integration client"""
     logger.info("Starting Factory.8090.ai integration exploration")
     
-    async with Factory8090Client() as client:
-        # Discover service information
-        service_info = await client.discover_service_info()
-        print(f"Service Info: {service_info.dict()}")
-        
-        # Extract page data
-        page_data = await client.extract_page_data()
-        print(f"Page Data: {json.dumps(page_data, indent=2)}")
-        
-        # Test discovered API endpoints
-        if service_info.api_endpoints:
-            api_results = await client.test_api_endpoints(service_info.api_endpoints)
-            print(f"API Test Results: {json.dumps(api_results, indent=2)}")
-        else:
-            print("No API endpoints discovered")
+    try:
+        async with Factory8090Client() as client:
+            # Discover service information
+            service_info = await client.discover_service_info()
+            print(f"Service Info: {client._last_service_info_dict}")
+            
+            # Extract page data
+            page_data = await client.extract_page_data()
+            print(f"Page Data: {json.dumps(page_data, indent=2)}")
+            
+            # Test discovered API endpoints
+            if service_info.api_endpoints:
+                api_results = await client.test_api_endpoints(service_info.api_endpoints)
+                print(f"API Test Results: {json.dumps(api_results, indent=2)}")
+            else:
+                print("No API endpoints discovered")
+    finally:
+        await shutdown_shared_browser()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Fast JSON helpers for 8090 Integrations
+
+Serializes with orjson when it is installed, falling back to ujson and
+finally the standard library json module.
+"""
+
+import dataclasses
+import json
+import os
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for types the JSON backends do not handle natively"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent the output with two spaces
+
+    Returns:
+        JSON document as bytes
+    """
+    # The fast backends reject some documents json accepts, such as non-str dict
+    # keys and integers beyond 64 bits; those fall through to json
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            pass
+    elif ujson is not None:
+        try:
+            return ujson.dumps(obj, indent=2 if pretty else 0, ensure_ascii=False,
+                               default=_default).encode("utf-8")
+        except (TypeError, OverflowError):
+            pass
+
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False,
+                      default=_default).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON document from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def write_bytes(filepath: str, data: bytes) -> None:
+    """Write a whole serialized document to a file with raw os.write calls, bypassing text-mode buffering"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def dump_file(obj: Any, filepath: str, pretty: bool = False) -> None:
+    """Serialize an object and write it to a file"""
+    write_bytes(filepath, dumps(obj, pretty=pretty))
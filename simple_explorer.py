@@ -6,21 +6,326 @@ A simplified version that works with basic Python packages to explore
 the Factory.8090.ai service.
 """
 
-import json
+import codecs
+import copy
+import http.client
 import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
+import urllib.error
 import urllib.request
 import urllib.parse
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+import fastjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Failures expected when talking to a remote host. Timeouts, refused or reset
+# connections and TLS errors are OSError subclasses; ValueError covers
+# malformed or unsupported URLs
+_NETWORK_ERRORS = (urllib.error.URLError, OSError, http.client.HTTPException, ValueError)
+
+# Failures decoding a compressed response body
+_DECODE_ERRORS = (zlib.error, brotli.error) if brotli is not None else (zlib.error,)
+
+# Seconds a generated report is reused for the same base URL
+REPORT_CACHE_TTL = 300
+
+# Maximum number of (explorer type, base URL) reports kept in the report cache
+REPORT_CACHE_SIZE = 32
+
+# Number of endpoints probed concurrently by test_endpoints
+MAX_PROBE_WORKERS = 8
+
+# Content codings the explorer can decompress
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+# Size of the chunks read from the page response
+READ_CHUNK_SIZE = 64 * 1024
+
+# Redirects followed per endpoint probe, as urllib's redirect handler did
+MAX_REDIRECTS = 10
+
+# Statuses whose Location header an endpoint probe follows
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class _DeflateDecompressor:
+    """Streaming deflate decoder accepting both zlib-wrapped and raw deflate streams"""
+    
+    def __init__(self):
+        self._decompressor = None
+    
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._decompressor is None:
+            # A zlib header has compression method 8 and a 16-bit check value divisible by 31
+            is_zlib = len(chunk) >= 2 and (chunk[0] & 0x0F) == 8 and ((chunk[0] << 8) | chunk[1]) % 31 == 0
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS if is_zlib else -zlib.MAX_WBITS)
+        return self._decompressor.decompress(chunk)
+
+
+def _make_decompressor(content_encoding: str) -> Callable[[bytes], bytes]:
+    """Get a streaming function that undoes the response's Content-Encoding chunk by chunk"""
+    encoding = content_encoding.strip().lower()
+    
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    if encoding == 'deflate':
+        return _DeflateDecompressor().decompress
+    if encoding == 'br' and brotli is not None:
+        return brotli.Decompressor().process
+    return lambda chunk: chunk
+
+
+# URL prefixes treated as already absolute by test_endpoints
+_HTTP_SCHEMES = ('http://', 'https://')
+
+# Candidate strings with these prefixes are never HTTP endpoints
+_NON_ENDPOINT_PREFIXES = ('data:', 'javascript:', '#')
+
+
+def _response_charset(response) -> str:
+    """Get the codec named by the response's Content-Type charset, defaulting to UTF-8"""
+    charset = response.headers.get_content_charset('utf-8')
+    try:
+        codec = codecs.lookup(charset)
+    except LookupError:
+        return 'utf-8'
+    # Bytes-to-bytes and str-to-str codecs (base64, zlib, rot13) cannot decode a page
+    if not getattr(codec, '_is_text_encoding', True):
+        return 'utf-8'
+    return codec.name
+
+
+# Patterns used by SimpleFactoryExplorer.analyze_content on raw page text
+_API_CANDIDATE_RE = re.compile(r'["\']([^"\']*(?:api|endpoint|service|v\d+)[^"\']*)["\']', re.IGNORECASE)
+_SERVICE_RES = {
+    'version': re.compile(r'version["\']?\s*[:=]\s*["\']([^"\']*)["\']', re.IGNORECASE),
+    'name': re.compile(r'name["\']?\s*[:=]\s*["\']([^"\']*)["\']', re.IGNORECASE),
+    'description': re.compile(r'description["\']?\s*[:=]\s*["\']([^"\']*)["\']', re.IGNORECASE),
+}
+
+# Hyperscan database id for the API candidate pattern; service patterns follow it
+_API_CANDIDATE_ID = 0
+_SERVICE_KEYS = tuple(_SERVICE_RES)
+
+
+def _build_hyperscan_db():
+    """Compile the API candidate and service info patterns into one Hyperscan database"""
+    if hyperscan is None:
+        return None
+    
+    # Hyperscan reports match offsets only, so the capturing groups are dropped
+    # here and the caller re-runs the compiled pattern on each matched span
+    expressions = [rb'["\'][^"\']*(?:api|endpoint|service|v\d+)[^"\']*["\']'] + [
+        key.encode() + rb'["\']?\s*[:=]\s*["\'][^"\']*["\']' for key in _SERVICE_KEYS
+    ]
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+    )
+    return db
+
+
+_HS_DB = _build_hyperscan_db()
+
+# A Hyperscan scratch space serves one scan at a time, and explorers may scan
+# from several threads at once, so every thread allocates its own
+_hs_local = threading.local()
+
+
+def _hs_scratch():
+    """Get this thread's Hyperscan scratch space for _HS_DB"""
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    return scratch
+
+
+def _scan_text(content: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Find API candidates and service info in raw page text.
+    
+    Uses a single Hyperscan pass over the page when available, otherwise one
+    pass per compiled regular expression.
+    
+    Returns:
+        Tuple of (API candidate strings in document order, service info values)
+    """
+    if _HS_DB is None:
+        service_info = {}
+        for key, pattern in _SERVICE_RES.items():
+            match = pattern.search(content)
+            if match:
+                service_info[key] = match.group(1)
+        return _API_CANDIDATE_RE.findall(content), service_info
+    
+    data = content.encode('utf-8')
+    candidates = []
+    last_candidate_end = -1
+    service_spans: Dict[int, Tuple[int, int]] = {}
+    
+    def on_match(match_id, start, end, flags, context):
+        nonlocal last_candidate_end
+        if match_id == _API_CANDIDATE_ID:
+            # Keep non-overlapping matches so results agree with re.findall
+            if start >= last_candidate_end:
+                candidates.append(data[start + 1:end - 1].decode('utf-8', errors='replace'))
+                last_candidate_end = end
+        elif match_id not in service_spans or start < service_spans[match_id][0]:
+            # re.search semantics: keep the leftmost match
+            service_spans[match_id] = (start, end)
+        return None
+    
+    _HS_DB.scan(data, match_event_handler=on_match, scratch=_hs_scratch())
+    
+    service_info = {}
+    for match_id, (start, end) in sorted(service_spans.items()):
+        key = _SERVICE_KEYS[match_id - 1]
+        match = _SERVICE_RES[key].match(data[start:end].decode('utf-8', errors='replace'))
+        if match:
+            service_info[key] = match.group(1)
+    
+    return candidates, service_info
+
+
+# Canonical upper-case form methods; anything unrecognised falls back to GET
+_FORM_METHODS = {
+    'get': 'GET',
+    'post': 'POST',
+    'put': 'PUT',
+    'delete': 'DELETE',
+    'patch': 'PATCH',
+    'head': 'HEAD',
+    'options': 'OPTIONS',
+}
+
+
+@dataclass
+class FormInfo:
+    """Form discovered on a page"""
+    __slots__ = ('action', 'method', 'inputs')
+    action: str
+    method: str
+    inputs: List[str]
+
+
+class _PageParser(HTMLParser):
+    """Single-pass HTML parser collecting title, meta tags, scripts, forms and links"""
+    
+    def __init__(self, analysis: Dict[str, Any]):
+        super().__init__(convert_charrefs=True)
+        self.analysis = analysis
+        self._title_parts: List[str] = []
+        self._in_title = False
+        self._title_done = False
+        self._form: Optional[FormInfo] = None
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        
+        if tag == 'title':
+            self._in_title = not self._title_done
+        elif tag == 'meta':
+            name = attrs.get('name')
+            content = attrs.get('content')
+            if name is not None and content is not None:
+                self.analysis['meta_tags'][name] = content
+        elif tag == 'script':
+            src = attrs.get('src')
+            if src is not None:
+                self.analysis['scripts'].append(src)
+        elif tag == 'a':
+            href = attrs.get('href')
+            if href is not None:
+                self.analysis['links'].append(href)
+        elif tag == 'form':
+            self._close_form()
+            self._form = FormInfo(
+                action=attrs.get('action') or '',
+                method=_FORM_METHODS.get((attrs.get('method') or '').lower(), 'GET'),
+                inputs=[]
+            )
+        elif tag == 'input' and self._form is not None:
+            name = attrs.get('name')
+            if name is not None:
+                self._form.inputs.append(name)
+    
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self.analysis['title'] = ''.join(self._title_parts).strip()
+            self._in_title = False
+            self._title_done = True
+        elif tag == 'form':
+            self._close_form()
+    
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+    
+    def close(self):
+        super().close()
+        self._close_form()
+    
+    def _close_form(self):
+        if self._form is not None:
+            self.analysis['forms'].append(self._form)
+            self._form = None
+
+
+# Reports by (explorer type, base URL), tagged with the REPORT_CACHE_TTL bucket they were built in
+_report_cache: "OrderedDict[Tuple[type, str], Tuple[int, Dict[str, Any]]]" = OrderedDict()
+_report_cache_lock = threading.Lock()
 
 
 class SimpleFactoryExplorer:
     """Simple explorer for Factory.8090.ai service"""
     
+    __slots__ = ('base_url', '_idle_connections', '_connections_lock')
+    
     def __init__(self, base_url: str = "https://factory.8090.ai"):
         self.base_url = base_url
+        # Idle keep-alive connections per (scheme, host), shared by probe threads
+        self._idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._connections_lock = threading.Lock()
+        
+    def close(self) -> None:
+        """Close any keep-alive connections opened for endpoint probing"""
+        with self._connections_lock:
+            for connections in self._idle_connections.values():
+                for connection in connections:
+                    connection.close()
+            self._idle_connections.clear()
         
-    def fetch_page_content(self) -> Dict[str, Any]:
-        """Fetch and analyze the main page content"""
+    def fetch_page_content(self, analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch the main page content.
+        
+        The body is decompressed and decoded incrementally. When an analysis
+        dict is given, the decoded chunks are also fed to the HTML parser as
+        they arrive, so analyze_content does not need to parse them again.
+        
+        The decoded text is still returned in full as 'content': the API
+        candidate and service info scans in analyze_content run over the whole
+        page, and their matches can span any number of chunks. Streaming saves
+        the separate decompress and decode copies of the body, not the text itself.
+        """
         print(f"🔍 Fetching content from {self.base_url}")
         
         try:
@@ -31,38 +336,56 @@ class SimpleFactoryExplorer:
                     'User-Agent': 'Factory.8090.ai Integration Explorer/1.0',
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                     'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
+                    'Accept-Encoding': ACCEPT_ENCODING,
                     'Connection': 'keep-alive',
                 }
             )
             
             with urllib.request.urlopen(req, timeout=30) as response:
-                content = response.read()
+                decompress = _make_decompressor(response.headers.get('Content-Encoding', ''))
+                decoder = codecs.getincrementaldecoder(_response_charset(response))(errors='replace')
+                parser = _PageParser(analysis) if analysis is not None else None
+                parts = []
+                content_length = 0
+                
+                while True:
+                    chunk = response.read1(READ_CHUNK_SIZE)
+                    final = not chunk
+                    data = decompress(chunk) if chunk else b''
+                    content_length += len(data)
+                    text = decoder.decode(data, final=final)
+                    if text:
+                        parts.append(text)
+                        if parser is not None:
+                            parser.feed(text)
+                    if final:
+                        break
+                
+                if parser is not None:
+                    parser.close()
                 
-                # Try to decode as UTF-8
-                try:
-                    html_content = content.decode('utf-8')
-                except UnicodeDecodeError:
-                    html_content = content.decode('utf-8', errors='ignore')
+                # The whole text is kept for the regex scans in analyze_content
+                html_content = ''.join(parts)
                 
                 return {
                     'status_code': response.getcode(),
-                    'headers': dict(response.headers),
-                    'content_length': len(content),
+                    'content_length': content_length,
                     'content': html_content,
                     'success': True
                 }
                 
-        except Exception as e:
+        except _NETWORK_ERRORS + _DECODE_ERRORS as e:
             return {
                 'success': False,
                 'error': str(e),
+                'error_type': type(e).__name__,
                 'status_code': None
             }
     
-    def analyze_content(self, content: str) -> Dict[str, Any]:
-        """Analyze the HTML content for integration opportunities"""
-        analysis = {
+    @staticmethod
+    def new_analysis() -> Dict[str, Any]:
+        """Create an empty analysis dict"""
+        return {
             'title': '',
             'meta_tags': {},
             'scripts': [],
@@ -72,116 +395,170 @@ class SimpleFactoryExplorer:
             'potential_apis': [],
             'service_info': {}
         }
+    
+    def analyze_content(self, content: str, analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Analyze the HTML content for integration opportunities.
         
-        # Extract title
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-        if title_match:
-            analysis['title'] = title_match.group(1).strip()
-        
-        # Extract meta tags
-        meta_pattern = r'<meta[^>]*name=["\']([^"\']*)["\'][^>]*content=["\']([^"\']*)["\'][^>]*>'
-        for match in re.finditer(meta_pattern, content, re.IGNORECASE):
-            analysis['meta_tags'][match.group(1)] = match.group(2)
-        
-        # Extract script sources
-        script_pattern = r'<script[^>]*src=["\']([^"\']*)["\'][^>]*>'
-        for match in re.finditer(script_pattern, content, re.IGNORECASE):
-            analysis['scripts'].append(match.group(1))
-        
-        # Look for potential API endpoints
-        api_patterns = [
-            r'["\']([^"\']*api[^"\']*)["\']',
-            r'["\']([^"\']*endpoint[^"\']*)["\']',
-            r'["\']([^"\']*service[^"\']*)["\']',
-            r'["\']([^"\']*v\d+[^"\']*)["\']',  # Versioned APIs
-        ]
-        
-        for pattern in api_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            analysis['potential_apis'].extend(matches)
-        
-        # Extract forms
-        form_pattern = r'<form[^>]*>(.*?)</form>'
-        for match in re.finditer(form_pattern, content, re.IGNORECASE | re.DOTALL):
-            form_content = match.group(1)
-            form_info = {
-                'action': '',
-                'method': 'GET',
-                'inputs': []
-            }
-            
-            # Extract form action
-            action_match = re.search(r'action=["\']([^"\']*)["\']', form_content, re.IGNORECASE)
-            if action_match:
-                form_info['action'] = action_match.group(1)
+        Pass the analysis dict already filled in by fetch_page_content to skip
+        re-parsing the HTML structure.
+        """
+        if analysis is None:
+            analysis = self.new_analysis()
             
-            # Extract form method
-            method_match = re.search(r'method=["\']([^"\']*)["\']', form_content, re.IGNORECASE)
-            if method_match:
-                form_info['method'] = method_match.group(1).upper()
-            
-            # Extract input fields
-            input_pattern = r'<input[^>]*name=["\']([^"\']*)["\'][^>]*>'
-            for input_match in re.finditer(input_pattern, form_content, re.IGNORECASE):
-                form_info['inputs'].append(input_match.group(1))
-            
-            analysis['forms'].append(form_info)
-        
-        # Extract links
-        link_pattern = r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>'
-        for match in re.finditer(link_pattern, content, re.IGNORECASE):
-            analysis['links'].append(match.group(1))
-        
-        # Look for service information
-        service_patterns = {
-            'version': r'version["\']?\s*[:=]\s*["\']([^"\']*)["\']',
-            'name': r'name["\']?\s*[:=]\s*["\']([^"\']*)["\']',
-            'description': r'description["\']?\s*[:=]\s*["\']([^"\']*)["\']',
-        }
+            # Extract title, meta tags, script sources, forms and links in one pass
+            parser = _PageParser(analysis)
+            parser.feed(content)
+            parser.close()
         
-        for key, pattern in service_patterns.items():
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                analysis['service_info'][key] = match.group(1)
+        # Look for potential API endpoints and service information
+        candidates, analysis['service_info'] = _scan_text(content)
+        
+        # Resolve against the base URL so one endpoint written several ways is kept once
+        analysis['potential_apis'] = list(dict.fromkeys(
+            urllib.parse.urljoin(self.base_url, match)
+            for match in candidates
+            if match and not match.startswith(_NON_ENDPOINT_PREFIXES)
+        ))
         
         return analysis
     
     def test_endpoints(self, endpoints: List[str]) -> Dict[str, Any]:
         """Test potential API endpoints"""
-        results = {}
-        
+        targets = []
         for endpoint in endpoints[:10]:  # Limit to first 10 endpoints
-            if not endpoint.startswith('http'):
+            if not endpoint.startswith(_HTTP_SCHEMES):
                 endpoint = urllib.parse.urljoin(self.base_url, endpoint)
+            targets.append(endpoint)
+        
+        if not targets:
+            return {}
+        
+        # Probes are independent network calls, so run them on a thread pool
+        with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(targets))) as executor:
+            return dict(zip(targets, executor.map(self._probe, targets)))
+    
+    def _probe(self, endpoint: str) -> Dict[str, Any]:
+        """Probe a single endpoint"""
+        try:
+            # HEAD is enough to check the endpoint; the size comes from Content-Length,
+            # and is None when the server does not send one (e.g. chunked responses)
+            response = self._request('HEAD', endpoint, timeout=10)
+            content_length = response.getheader('content-length')
+            return {
+                'status_code': response.status,
+                'content_type': response.getheader('content-type', ''),
+                'success': 200 <= response.status < 300,
+                'size': int(content_length) if content_length and content_length.isdigit() else None
+            }
+                
+        except _NETWORK_ERRORS as e:
+            return {
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'success': False
+            }
+    
+    def _checkout_connection(self, scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+        """Take an idle connection for the host, or open a new one"""
+        with self._connections_lock:
+            idle = self._idle_connections.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        if scheme == 'http':
+            return http.client.HTTPConnection(netloc, timeout=timeout)
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+    
+    def _checkin_connection(self, scheme: str, netloc: str, connection: http.client.HTTPConnection) -> None:
+        """Return a connection to the idle pool for reuse"""
+        with self._connections_lock:
+            self._idle_connections.setdefault((scheme, netloc), []).append(connection)
+    
+    def _request(self, method: str, url: str, timeout: float) -> http.client.HTTPResponse:
+        """Send a request, following up to MAX_REDIRECTS redirects through the connection pool"""
+        response = self._send(method, url, timeout)
+        for _ in range(MAX_REDIRECTS):
+            location = response.getheader('location')
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+            response = self._send(method, url, timeout)
+        return response
+    
+    def _send(self, method: str, url: str, timeout: float) -> http.client.HTTPResponse:
+        """Send a request over a reused keep-alive connection for the URL's host"""
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        
+        for attempt in range(2):
+            connection = self._checkout_connection(parts.scheme, parts.netloc, timeout)
             
             try:
-                req = urllib.request.Request(
-                    endpoint,
-                    headers={'User-Agent': 'Factory.8090.ai Integration Explorer/1.0'}
-                )
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    results[endpoint] = {
-                        'status_code': response.getcode(),
-                        'content_type': response.headers.get('content-type', ''),
-                        'success': 200 <= response.getcode() < 300,
-                        'size': len(response.read())
-                    }
-                    
-            except Exception as e:
-                results[endpoint] = {
-                    'error': str(e),
-                    'success': False
-                }
+                connection.request(method, path, headers={
+                    'User-Agent': 'Factory.8090.ai Integration Explorer/1.0',
+                    'Connection': 'keep-alive',
+                })
+                response = connection.getresponse()
+                response.read()  # Drain so the connection can be reused
+            except (ConnectionError, http.client.BadStatusLine):
+                # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+            
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin_connection(parts.scheme, parts.netloc, connection)
+            return response
+    
+    def generate_report(self, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Generate comprehensive integration report.
+        
+        Reports are cached per explorer type and base URL for REPORT_CACHE_TTL
+        seconds; pass use_cache=False to force a fresh fetch. Reports are built
+        by this explorer, over its keep-alive connections, and every call gets
+        its own copy that it is free to modify. Failed reports are not cached.
+        """
+        if not use_cache:
+            return self._build_report()
+        
+        key = (type(self), self.base_url)
+        bucket = int(time.time() // REPORT_CACHE_TTL)
+        with _report_cache_lock:
+            cached = _report_cache.get(key)
+            if cached is not None and cached[0] == bucket:
+                _report_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+        
+        report = self._build_report()
+        if 'error' in report:
+            return report
         
-        return results
+        with _report_cache_lock:
+            _report_cache[key] = (bucket, copy.deepcopy(report))
+            _report_cache.move_to_end(key)
+            if len(_report_cache) > REPORT_CACHE_SIZE:
+                _report_cache.popitem(last=False)
+        return report
     
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate comprehensive integration report"""
+    def _build_report(self) -> Dict[str, Any]:
+        """Fetch, analyze and probe the service to build a report"""
         print("📊 Generating integration report...")
         
-        # Fetch page content
-        page_data = self.fetch_page_content()
+        # Fetch page content, parsing the HTML structure as it streams in
+        analysis = self.new_analysis()
+        page_data = self.fetch_page_content(analysis)
         
         if not page_data['success']:
             return {
@@ -190,15 +567,18 @@ class SimpleFactoryExplorer:
             }
         
         # Analyze content
-        analysis = self.analyze_content(page_data['content'])
+        analysis = self.analyze_content(page_data['content'], analysis)
         
         # Test potential endpoints
         api_results = {}
         if analysis['potential_apis']:
             api_results = self.test_endpoints(analysis['potential_apis'])
         
+        # Endpoints that answered successfully feed both recommendations and opportunities
+        successful_apis = [k for k, v in api_results.items() if v.get('success')]
+        
         # Generate recommendations
-        recommendations = self.generate_recommendations(analysis, api_results)
+        recommendations = self.generate_recommendations(analysis, successful_apis)
         
         report = {
             'service_info': {
@@ -211,14 +591,16 @@ class SimpleFactoryExplorer:
             'content_analysis': analysis,
             'api_testing': api_results,
             'recommendations': recommendations,
-            'integration_opportunities': self.identify_integration_opportunities(analysis, api_results)
+            'integration_opportunities': self.identify_integration_opportunities(analysis, successful_apis)
         }
         
         return report
     
-    def generate_recommendations(self, analysis: Dict, api_results: Dict) -> List[Dict]:
+    def generate_recommendations(self, analysis: Dict, successful_apis: List[str]) -> List[Dict]:
         """Generate integration recommendations"""
         recommendations = []
+        forms = analysis['forms']
+        scripts = analysis['scripts']
         
         # Check for API endpoints
         if not analysis['potential_apis']:
@@ -228,31 +610,29 @@ class SimpleFactoryExplorer:
                 'description': 'No obvious API endpoints found. Consider browser automation.',
                 'action': 'Implement Playwright or Selenium for service interaction'
             })
-        else:
-            successful_apis = [k for k, v in api_results.items() if v.get('success')]
-            if successful_apis:
-                recommendations.append({
-                    'type': 'api_integration',
-                    'priority': 'high',
-                    'description': f'Found {len(successful_apis)} working API endpoints.',
-                    'action': 'Implement REST client for discovered endpoints'
-                })
+        elif successful_apis:
+            recommendations.append({
+                'type': 'api_integration',
+                'priority': 'high',
+                'description': f'Found {len(successful_apis)} working API endpoints.',
+                'action': 'Implement REST client for discovered endpoints'
+            })
         
         # Check for forms
-        if analysis['forms']:
+        if forms:
             recommendations.append({
                 'type': 'form_automation',
                 'priority': 'medium',
-                'description': f'Found {len(analysis["forms"])} forms for automation.',
+                'description': f'Found {len(forms)} forms for automation.',
                 'action': 'Implement form filling and submission automation'
             })
         
         # Check for JavaScript
-        if analysis['scripts']:
+        if scripts:
             recommendations.append({
                 'type': 'javascript_analysis',
                 'priority': 'medium',
-                'description': f'Found {len(analysis["scripts"])} JavaScript files. May contain API calls.',
+                'description': f'Found {len(scripts)} JavaScript files. May contain API calls.',
                 'action': 'Analyze JavaScript files for hidden API endpoints'
             })
         
@@ -274,12 +654,11 @@ class SimpleFactoryExplorer:
         
         return recommendations
     
-    def identify_integration_opportunities(self, analysis: Dict, api_results: Dict) -> List[Dict]:
+    def identify_integration_opportunities(self, analysis: Dict, successful_apis: List[str]) -> List[Dict]:
         """Identify specific integration opportunities"""
         opportunities = []
         
         # API integration opportunities
-        successful_apis = [k for k, v in api_results.items() if v.get('success')]
         if successful_apis:
             opportunities.append({
                 'type': 'REST API Integration',
@@ -315,11 +694,13 @@ def main():
     print("=" * 50)
     
     explorer = SimpleFactoryExplorer()
-    report = explorer.generate_report()
+    try:
+        report = explorer.generate_report()
+    finally:
+        explorer.close()
     
     # Save report
-    with open('factory_8090_integration_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    fastjson.dump_file(report, 'factory_8090_integration_report.json', pretty=True)
     
     # Display summary
     print(f"\n✅ Exploration completed!")
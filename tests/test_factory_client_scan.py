@@ -0,0 +1,52 @@
+"""
+Tests for the Hyperscan content scanner in factory_client
+
+The Hyperscan path must return the same endpoints and capabilities, in the
+same order, as the re.findall fallback, including from concurrent threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("hyperscan")
+factory_client = pytest.importorskip("factory_client")
+
+
+SAMPLES = [
+    "",
+    "no quotes here at all",
+    '<script>fetch("/api/v1/work-orders"); fetch(\'/api/tasks\')</script>',
+    '"/API/Items" "/service/health" "endpoint-list" "/api/v1/work-orders"',
+    '{"capability": "search", "feature_flags": ["beta"], "functionName": "run"}',
+    '"a api b" "c" "service" \'endpoint\' "capability" "feature"',
+    '"api" "api" "Api" "feature" "feature"',
+    '"unterminated api',
+    '"api"api"api" "x feature y\'z function"',
+    'prefix "ümlaut-api-ü" "naïve feature" suffix',
+    '\'"mixed api quotes"\' "nested \'service\' value"',
+]
+
+
+def _scan_with_regex(monkeypatch, content):
+    """Run _scan_content through the re.findall fallback"""
+    with monkeypatch.context() as patch:
+        patch.setattr(factory_client, "_HS_DB", None)
+        return factory_client._scan_content(content)
+
+
+@pytest.mark.skipif(factory_client._HS_DB is None, reason="Hyperscan database unavailable")
+@pytest.mark.parametrize("content", SAMPLES)
+def test_hyperscan_matches_regex_fallback(monkeypatch, content):
+    assert factory_client._scan_content(content) == _scan_with_regex(monkeypatch, content)
+
+
+@pytest.mark.skipif(factory_client._HS_DB is None, reason="Hyperscan database unavailable")
+def test_hyperscan_concurrent_scans(monkeypatch):
+    contents = SAMPLES * 50
+    expected = [_scan_with_regex(monkeypatch, content) for content in contents]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(factory_client._scan_content, contents))
+
+    assert results == expected
@@ -0,0 +1,52 @@
+"""
+Tests for the Hyperscan page scanner in simple_explorer
+
+The Hyperscan path must return the same API candidates and service info as
+the compiled regular expressions, including from concurrent threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("hyperscan")
+simple_explorer = pytest.importorskip("simple_explorer")
+
+
+SAMPLES = [
+    "",
+    "no quotes here at all",
+    '<script>fetch("/api/v1/work-orders"); fetch(\'/service/health\')</script>',
+    '"/API/Items" "endpoint-list" "/v2/tasks" "/api/v1/work-orders"',
+    '{"name": "Factory", "version": "1.2.3", "description": "Integrations"}',
+    'name = "first" name="second" VERSION: \'9\'',
+    '"a api b" "c" "service" \'endpoint\' "v" "v1"',
+    '"unterminated api',
+    '"api"api"api" "x service y\'z endpoint"',
+    'prefix "ümlaut-api-ü" description: "naïve" suffix',
+    '\'"mixed api quotes"\' "nested \'service\' value"',
+]
+
+
+def _scan_with_regex(monkeypatch, content):
+    """Run _scan_text through the compiled regular expressions"""
+    with monkeypatch.context() as patch:
+        patch.setattr(simple_explorer, "_HS_DB", None)
+        return simple_explorer._scan_text(content)
+
+
+@pytest.mark.skipif(simple_explorer._HS_DB is None, reason="Hyperscan database unavailable")
+@pytest.mark.parametrize("content", SAMPLES)
+def test_hyperscan_matches_regex_fallback(monkeypatch, content):
+    assert simple_explorer._scan_text(content) == _scan_with_regex(monkeypatch, content)
+
+
+@pytest.mark.skipif(simple_explorer._HS_DB is None, reason="Hyperscan database unavailable")
+def test_hyperscan_concurrent_scans(monkeypatch):
+    contents = SAMPLES * 50
+    expected = [_scan_with_regex(monkeypatch, content) for content in contents]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(simple_explorer._scan_text, contents))
+
+    assert results == expected
@@ -0,0 +1,84 @@
+"""
+Tests for timestamp parsing in work_order_indexer
+
+_parse_timestamp_string replaces a sweep of datetime.strptime formats and
+must accept and reject exactly the strings that sweep did.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+work_order_indexer = pytest.importorskip("work_order_indexer")
+
+
+STRPTIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+]
+
+CASES = [
+    "2024-01-02",
+    "2024-1-2",
+    "2024-01- 2",
+    "2024-02-30",
+    "2024-13-01",
+    "2024-01-02T03:04:05",
+    "2024-01-02t03:04:05",
+    "2024-01-02T03:04:05Z",
+    "2024-01-02T03:04:05z",
+    "2024-01-02T03:04:05.1Z",
+    "2024-01-02T03:04:05.123456z",
+    "2024-01-02T03:04:05.1234567Z",
+    "2024-01-02T03:04:05.5",
+    "2024-01-02T3:4:5",
+    "2024-01-02T24:00:00",
+    "2024-01-02T03:04:60",
+    "2024-01-02 03:04:05",
+    "2024-01-02 \t 03:04:05",
+    "2024-01-02 03:04:05Z",
+    "2024-01-02 03:04:05.5Z",
+    "24-01-02",
+    "2024-01-02T",
+    "2024-01-02 ",
+    "not a timestamp",
+]
+
+
+def _parse_with_strptime(timestamp):
+    """The format sweep _parse_timestamp used before the regex parser"""
+    for fmt in STRPTIME_FORMATS:
+        try:
+            return datetime.strptime(timestamp, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _mutated_cases(count):
+    """Timestamps built from valid ones with random pieces swapped out"""
+    rng = random.Random(8090)
+    pieces = ["2024", "-", "01", "-", "02", "T", "03", ":", "04", ":", "05", ".", "5", "Z"]
+    atoms = ["2024", "-", "1", "13", "31", "29", " 5", " ", "T", "t", "Z", "z", "\t",
+             "10", "24", "59", "60", ":", ".", "123", "1234567", "0", "00", "x"]
+    for _ in range(count):
+        case = pieces[:rng.choice([5, 11, 13, 14])]
+        for _ in range(rng.randint(0, 3)):
+            case[rng.randrange(len(case))] = rng.choice(atoms)
+        yield "".join(case)
+
+
+@pytest.mark.parametrize("timestamp", CASES)
+def test_matches_strptime_formats(timestamp):
+    parse = work_order_indexer._parse_timestamp_string.__wrapped__
+    assert parse(timestamp) == _parse_with_strptime(timestamp)
+
+
+def test_matches_strptime_formats_on_mutated_inputs():
+    parse = work_order_indexer._parse_timestamp_string.__wrapped__
+    mismatches = [case for case in _mutated_cases(20000) if parse(case) != _parse_with_strptime(case)]
+    assert mismatches == []
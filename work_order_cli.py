@@ -8,14 +8,88 @@ Factory.8090.ai service.
 
 import argparse
 import asyncio
-import json
+import atexit
+import shutil
 import sys
 from datetime import datetime
+from heapq import nlargest
+from operator import attrgetter
 from typing import List, Optional
 
+import fastjson
 from work_order_indexer import WorkOrderIndexer, WorkOrderStatus, WorkOrderPriority
 
 
+# Accepted --status and --priority values, in enum definition order
+_STATUSES = {status.value: status for status in WorkOrderStatus}
+_PRIORITIES = {priority.value: priority for priority in WorkOrderPriority}
+
+# Report banners, each followed by its divider line
+_DIVIDER = "=" * 30
+_STATS_HEADER = f"📊 Work Order Statistics\n{_DIVIDER}"
+_DETAILS_HEADER = f"📋 Work Order Details\n{_DIVIDER}"
+
+# Characters of a description shown in work order listings
+DESCRIPTION_PREVIEW_LENGTH = 100
+
+# Event loop reused by every run_index call in the process, created on first use
+_index_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_index_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide indexing event loop, creating it on first use"""
+    global _index_loop
+    if _index_loop is None or _index_loop.is_closed():
+        _index_loop = asyncio.new_event_loop()
+        atexit.register(_close_index_loop, _index_loop)
+    return _index_loop
+
+
+def _close_index_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Finalize async generators and close an indexing loop at interpreter exit"""
+    if not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _format_timestamp(dt: datetime) -> str:
+    """Format a timestamp as 'YYYY-MM-DD HH:MM:SS' (same as strftime, without the format parsing)"""
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt.isoformat(' ', 'seconds')
+
+
+def _preview(text: str) -> str:
+    """Shorten text to DESCRIPTION_PREVIEW_LENGTH characters, marking a cut with '...'"""
+    if len(text) <= DESCRIPTION_PREVIEW_LENGTH:
+        return text
+    return f"{text[:DESCRIPTION_PREVIEW_LENGTH]}..."
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout as one pre-encoded block, bypassing the text layer when possible"""
+    text = "\n".join(lines) + "\n"
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        # Redirected to an in-memory text stream
+        stdout.write(text)
+        return
+    
+    stdout.flush()
+    buffer.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+    buffer.flush()
+
+
+def _page_lines(lines: List[str]) -> None:
+    """Show lines through the user's pager when they would scroll off an interactive terminal"""
+    if sys.stdout.isatty() and len(lines) > shutil.get_terminal_size().lines:
+        import pydoc
+        pydoc.pager("\n".join(lines))
+    else:
+        _write_lines(lines)
+
+
 class WorkOrderCLI:
     """Command-line interface for work order management"""
     
@@ -56,59 +130,86 @@ class WorkOrderCLI:
             print(f"❌ Error during indexing: {e}")
             sys.exit(1)
     
+    def run_index(self, args, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Run the index command to completion.
+        
+        For batch drivers that index repeatedly in one process. Runs on the
+        given loop, or on one process-wide loop kept across calls, so they
+        reuse its executor and resolver instead of having asyncio.run build
+        and tear them down each time. main() uses asyncio.run for its single
+        index run.
+        """
+        if loop is None:
+            loop = _get_index_loop()
+        loop.run_until_complete(self.index_command(args))
+    
     def list_command(self, args) -> None:
         """List work orders"""
         if args.status:
-            try:
-                status = WorkOrderStatus(args.status)
-                work_orders = self.indexer.index.get_work_orders_by_status(status)
-            except ValueError:
+            status = _STATUSES.get(args.status)
+            if status is None:
                 print(f"❌ Invalid status: {args.status}")
-                print(f"Valid statuses: {', '.join([s.value for s in WorkOrderStatus])}")
+                print(f"Valid statuses: {', '.join(_STATUSES)}")
                 sys.exit(1)
+            work_orders = self.indexer.index.get_work_orders_by_status(status)
         elif args.priority:
-            try:
-                priority = WorkOrderPriority(args.priority)
-                work_orders = self.indexer.index.get_work_orders_by_priority(priority)
-            except ValueError:
+            priority = _PRIORITIES.get(args.priority)
+            if priority is None:
                 print(f"❌ Invalid priority: {args.priority}")
-                print(f"Valid priorities: {', '.join([p.value for p in WorkOrderPriority])}")
+                print(f"Valid priorities: {', '.join(_PRIORITIES)}")
                 sys.exit(1)
+            work_orders = self.indexer.index.get_work_orders_by_priority(priority)
         elif args.assigned:
             work_orders = self.indexer.index.get_work_orders_by_assigned(args.assigned)
         elif args.tag:
             work_orders = self.indexer.index.get_work_orders_by_tag(args.tag)
         else:
-            work_orders = list(self.indexer.index.work_orders.values())
+            # A view over the index; only the selected rows below are ever copied into a list
+            work_orders = self.indexer.index.work_orders.values()
         
         if not work_orders:
             print("📭 No work orders found")
             return
         
-        # Sort by created date (newest first)
-        work_orders.sort(key=lambda x: x.created_at, reverse=True)
-        
-        # Limit results
-        if args.limit:
-            work_orders = work_orders[:args.limit]
+        # Sort by created date (newest first); with a limit only the newest
+        # entries are needed, so select them with a heap instead of a full sort
+        created_at = attrgetter('created_at')
+        if args.limit and args.limit > 0:
+            work_orders = nlargest(args.limit, work_orders, key=created_at)
+        else:
+            work_orders = sorted(work_orders, key=created_at, reverse=True)
+            
+            # Limit results
+            if args.limit:
+                work_orders = work_orders[:args.limit]
         
-        print(f"📋 Found {len(work_orders)} work orders:")
-        print()
+        # Build the whole listing and write it in one go rather than one print per field
+        lines = [f"📋 Found {len(work_orders)} work orders:", ""]
+        append = lines.append
         
         for i, wo in enumerate(work_orders, 1):
-            print(f"{i:3d}. {wo.title}")
-            print(f"     ID: {wo.id}")
-            print(f"     Status: {wo.status.value}")
-            print(f"     Priority: {wo.priority.value}")
-            print(f"     Created: {wo.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            if wo.assigned_to:
-                print(f"     Assigned: {wo.assigned_to}")
-            if wo.tags:
-                print(f"     Tags: {', '.join(wo.tags)}")
-            if wo.description:
-                desc = wo.description[:100] + "..." if len(wo.description) > 100 else wo.description
-                print(f"     Description: {desc}")
-            print()
+            assigned_to = wo.assigned_to
+            tags = wo.tags
+            description = wo.description
+            
+            # The fixed fields of a row go out as one multi-line entry
+            append(
+                f"{i:3d}. {wo.title}\n"
+                f"     ID: {wo.id}\n"
+                f"     Status: {wo.status.value}\n"
+                f"     Priority: {wo.priority.value}\n"
+                f"     Created: {_format_timestamp(wo.created_at)}"
+            )
+            if assigned_to:
+                append(f"     Assigned: {assigned_to}")
+            if tags:
+                append(f"     Tags: {', '.join(tags)}")
+            if description:
+                append(f"     Description: {_preview(description)}")
+            append("")
+        
+        _write_lines(lines)
     
     def search_command(self, args) -> None:
         """Search work orders"""
@@ -118,51 +219,54 @@ class WorkOrderCLI:
         
         print(f"🔍 Searching for: '{args.query}'")
         
-        work_orders = self.indexer.search_work_orders(args.query)
+        work_order_ids = self.indexer.search_work_order_ids(args.query)
         
-        if not work_orders:
+        if not work_order_ids:
             print("📭 No work orders found matching your search")
             return
         
-        print(f"📋 Found {len(work_orders)} matching work orders:")
-        print()
+        lines = [f"📋 Found {len(work_order_ids)} matching work orders:", ""]
+        append = lines.append
         
+        # Resolve matches lazily while formatting instead of building a list of work orders first;
+        # every row is still formatted up front, since _page_lines needs them all to decide on paging
+        work_orders = map(self.indexer.index.work_orders.__getitem__, work_order_ids)
         for i, wo in enumerate(work_orders, 1):
-            print(f"{i:3d}. {wo.title}")
-            print(f"     ID: {wo.id}")
-            print(f"     Status: {wo.status.value}")
-            print(f"     Priority: {wo.priority.value}")
-            print(f"     Created: {wo.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            append(f"{i:3d}. {wo.title}")
+            append(f"     ID: {wo.id}")
+            append(f"     Status: {wo.status.value}")
+            append(f"     Priority: {wo.priority.value}")
+            append(f"     Created: {_format_timestamp(wo.created_at)}")
             if wo.assigned_to:
-                print(f"     Assigned: {wo.assigned_to}")
-            print()
+                append(f"     Assigned: {wo.assigned_to}")
+            append("")
+        
+        _page_lines(lines)
     
     def stats_command(self, args) -> None:
         """Show work order statistics"""
         stats = self.indexer.get_work_order_statistics()
         
-        print("📊 Work Order Statistics")
-        print("=" * 30)
-        print(f"Total work orders: {stats['total_work_orders']}")
-        print(f"Last indexed: {stats['last_index_time'] or 'Never'}")
-        print()
+        lines = [
+            _STATS_HEADER,
+            f"Total work orders: {stats['total_work_orders']}",
+            f"Last indexed: {stats['last_index_time'] or 'Never'}",
+            "",
+            "📈 Status Distribution:",
+        ]
+        lines.extend(f"  {status}: {count}" for status, count in stats['status_distribution'].items() if count > 0)
+        lines.append("")
         
-        print("📈 Status Distribution:")
-        for status, count in stats['status_distribution'].items():
-            if count > 0:
-                print(f"  {status}: {count}")
-        print()
+        lines.append("🎯 Priority Distribution:")
+        lines.extend(f"  {priority}: {count}" for priority, count in stats['priority_distribution'].items() if count > 0)
+        lines.append("")
         
-        print("🎯 Priority Distribution:")
-        for priority, count in stats['priority_distribution'].items():
-            if count > 0:
-                print(f"  {priority}: {count}")
-        print()
+        lines.append("👥 Assignment Info:")
+        lines.append(f"  Assigned work orders: {stats['assigned_count']}")
+        lines.append(f"  Unique tags: {stats['tags_count']}")
+        lines.append(f"  Search index size: {stats['search_index_size']}")
         
-        print("👥 Assignment Info:")
-        print(f"  Assigned work orders: {stats['assigned_count']}")
-        print(f"  Unique tags: {stats['tags_count']}")
-        print(f"  Search index size: {stats['search_index_size']}")
+        _write_lines(lines)
     
     def export_command(self, args) -> None:
         """Export work orders to JSON"""
@@ -194,31 +298,30 @@ class WorkOrderCLI:
             print(f"❌ Work order not found: {args.work_order_id}")
             sys.exit(1)
         
-        print(f"📋 Work Order Details")
-        print("=" * 30)
+        print(_DETAILS_HEADER)
         print(f"ID: {work_order.id}")
         print(f"Title: {work_order.title}")
         print(f"Description: {work_order.description}")
         print(f"Status: {work_order.status.value}")
         print(f"Priority: {work_order.priority.value}")
-        print(f"Created: {work_order.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Updated: {work_order.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Created: {_format_timestamp(work_order.created_at)}")
+        print(f"Updated: {_format_timestamp(work_order.updated_at)}")
         
         if work_order.assigned_to:
             print(f"Assigned to: {work_order.assigned_to}")
         
         if work_order.due_date:
-            print(f"Due date: {work_order.due_date.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"Due date: {_format_timestamp(work_order.due_date)}")
         
         if work_order.tags:
             print(f"Tags: {', '.join(work_order.tags)}")
         
         if work_order.metadata:
-            print(f"Metadata: {json.dumps(work_order.metadata, indent=2)}")
+            print(f"Metadata: {fastjson.dumps(work_order.metadata, pretty=True).decode('utf-8')}")
 
 
-def main():
-    """Main CLI function"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands"""
     parser = argparse.ArgumentParser(
         description="Work Order CLI for 8090 Integrations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -267,32 +370,50 @@ Examples:
     import_parser = subparsers.add_parser('import', help='Import work orders from JSON')
     import_parser.add_argument('--input', required=True, help='Input file path')
     
-    args = parser.parse_args()
+    return parser
+
+
+def _fast_path_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the trivial 'stats' and 'show ID' invocations without building the argparse tree"""
+    if argv == ['stats']:
+        return argparse.Namespace(command='stats')
+    if len(argv) == 2 and argv[0] == 'show' and not argv[1].startswith('-'):
+        return argparse.Namespace(command='show', work_order_id=argv[1])
+    return None
+
+
+def main():
+    """Main CLI function"""
+    args = _fast_path_args(sys.argv[1:])
     
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+        
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
     
     cli = WorkOrderCLI()
     
+    # A single invocation indexes once, so asyncio.run's fresh loop costs nothing
+    # to build; run_index's shared loop is for batch drivers that index repeatedly
+    commands = {
+        'index': lambda index_args: asyncio.run(cli.index_command(index_args)),
+        'list': cli.list_command,
+        'search': cli.search_command,
+        'stats': cli.stats_command,
+        'show': cli.show_command,
+        'export': cli.export_command,
+        'import': cli.import_command,
+    }
+    
     try:
-        if args.command == 'index':
-            asyncio.run(cli.index_command(args))
-        elif args.command == 'list':
-            cli.list_command(args)
-        elif args.command == 'search':
-            cli.search_command(args)
-        elif args.command == 'stats':
-            cli.stats_command(args)
-        elif args.command == 'show':
-            cli.show_command(args)
-        elif args.command == 'export':
-            cli.export_command(args)
-        elif args.command == 'import':
-            cli.import_command(args)
-        else:
+        command = commands.get(args.command)
+        if command is None:
             print(f"❌ Unknown command: {args.command}")
             sys.exit(1)
+        command(args)
             
     except KeyboardInterrupt:
         print("\n⏹️  Operation cancelled by user")
@@ -8,20 +8,34 @@ queued work orders.
 """
 
 import asyncio
+import functools
+import itertools
 import json
-import logging
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Any, Set, Tuple, Union
+from dataclasses import dataclass
+from collections import OrderedDict
 from enum import Enum
 import re
 import hashlib
+import sys
+from urllib.parse import urljoin
 
 import httpx
 import structlog
-from playwright.async_api import async_playwright, Browser, Page
-from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    # Playwright is only needed for discovery and is imported lazily in
+    # WorkOrderDiscovery.initialize, keeping CLI commands that only read the index fast
+    from playwright.async_api import Browser, Page
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+import fastjson
 
 # Configure structured logging
 structlog.configure(
@@ -44,6 +58,77 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Tokenizer shared by indexing and queries
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Maps every ASCII character that is not a word character to a space, so
+# ASCII text can be split without the regex engine
+_ASCII_NON_WORD = str.maketrans({
+    chr(c): ' ' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')
+})
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lower-cased word tokens, the same ones _WORD_RE finds"""
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD).lower().split()
+    return _WORD_RE.findall(text.lower())
+
+
+# Common words left out of the search index
+SEARCH_STOPWORDS = frozenset({"the", "a", "an", "is", "of", "and", "or", "to", "in"})
+
+# Maximum number of distinct queries kept in the LRU search result cache
+SEARCH_CACHE_SIZE = 256
+
+# Maximum number of distinct words indexed per work order, bounding the postings a single
+# pathological description can add
+SEARCH_MAX_WORDS_PER_WORK_ORDER = 4096
+
+# Upper bound on in-flight requests while probing API endpoints for work orders
+MAX_CONCURRENT_API_REQUESTS = 6
+
+# Header record written as the first line of NDJSON exports
+NDJSON_SCHEMA = "wo-ndjson-v1"
+
+# Export paths with these suffixes are written as NDJSON, one work order per line
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Timestamp layouts accepted from discovered data, matching what strptime accepted for
+# the formats it replaces: a date (the day may be space padded), optionally followed by a
+# "T" or whitespace separated time; "T" times may carry a fraction (with a trailing Z) or a Z.
+# strptime matches literals case-insensitively, so "t" and "z" are accepted too
+_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-([0-9]{1,2})-([0-9]{1,2}| [1-9])"
+    r"(?:(T|\s+)([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})(?:\.([0-9]{1,6}))?(Z)?)?",
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp_string(timestamp: str) -> Optional[datetime]:
+    """
+    Parse a timestamp string in one of the _TIMESTAMP_RE layouts, or return None.
+    
+    Discovered records repeat the same timestamps (sprint boundaries, shared
+    due dates), so results are memoized; datetimes are immutable and safe to share.
+    """
+    match = _TIMESTAMP_RE.fullmatch(timestamp)
+    if match is None:
+        return None
+    
+    year, month, day, separator, hour, minute, second, fraction, zulu = match.groups()
+    try:
+        if separator is None:
+            return datetime(int(year), int(month), int(day))
+        # A fraction needs the trailing Z, and whitespace separated times take neither
+        if (fraction and not zulu) or (zulu and separator not in "Tt"):
+            return None
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction.ljust(6, "0")) if fraction else 0)
+    except ValueError:
+        return None
+
 
 class WorkOrderStatus(Enum):
     """Work order status enumeration"""
@@ -65,7 +150,106 @@ class WorkOrderPriority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Enum members by value, for lookups that skip Enum.__call__
+_STATUS_BY_VALUE = {status.value: status for status in WorkOrderStatus}
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in WorkOrderPriority}
+
+# Enum values by member, cheaper per record than the Enum.value property
+_STATUS_VALUES = {status: status.value for status in WorkOrderStatus}
+_PRIORITY_VALUES = {priority: priority.value for priority in WorkOrderPriority}
+
+# Status and priority spellings seen in discovered data, keyed by casefolded value
+_STATUS_ALIASES = {
+    "queued": WorkOrderStatus.QUEUED,
+    "pending": WorkOrderStatus.QUEUED,
+    "in_progress": WorkOrderStatus.IN_PROGRESS,
+    "active": WorkOrderStatus.IN_PROGRESS,
+    "completed": WorkOrderStatus.COMPLETED,
+    "done": WorkOrderStatus.COMPLETED,
+    "failed": WorkOrderStatus.FAILED,
+    "error": WorkOrderStatus.FAILED,
+    "cancelled": WorkOrderStatus.CANCELLED,
+    "on_hold": WorkOrderStatus.ON_HOLD,
+    "paused": WorkOrderStatus.ON_HOLD
+}
+_PRIORITY_ALIASES = {
+    "low": WorkOrderPriority.LOW,
+    "medium": WorkOrderPriority.MEDIUM,
+    "high": WorkOrderPriority.HIGH,
+    "urgent": WorkOrderPriority.URGENT,
+    "critical": WorkOrderPriority.CRITICAL
+}
+
+# Keys accepted for each work order field in discovered data, most preferred first
+_FIELD_ALIASES = {
+    "id": ("id", "_id", "work_order_id"),
+    "title": ("title", "name", "subject"),
+    "description": ("description", "details", "summary"),
+    "status": ("status", "state"),
+    "priority": ("priority", "urgency"),
+    "created_at": ("created_at", "created", "timestamp"),
+    "updated_at": ("updated_at", "updated", "modified"),
+    "due_date": ("due_date", "deadline", "due"),
+    "assigned_to": ("assigned_to", "assignee", "owner"),
+    "tags": ("tags", "labels", "categories"),
+}
+
+# The same table keyed by alias, as (field, preference), so a record is read in one pass
+_ALIAS_FIELDS = {
+    alias: (field, rank)
+    for field, aliases in _FIELD_ALIASES.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Keys under which responses and page data carry lists of work orders, in extraction order
+_WORK_ORDER_KEYS = (
+    "work_orders", "workOrders", "tasks", "jobs", "orders",
+    "queue", "pending", "assigned", "work_items"
+)
+_WORK_ORDER_KEY_SET = frozenset(_WORK_ORDER_KEYS)
+
+# Record keys that map onto WorkOrder fields and so are left out of its metadata
+_METADATA_SKIP_KEYS = frozenset({
+    "id", "title", "description", "status", "priority",
+    "created_at", "updated_at", "due_date", "assigned_to", "tags"
+})
+
+
+def _fallback_id(data: Dict[str, Any]) -> str:
+    """
+    Derive an id for a record that has none from a BLAKE2b hash of its content.
+    
+    The record is hashed as compact sorted-key JSON from the standard library
+    json module, so the id does not depend on key order or on which JSON
+    backend is installed. Records json cannot sort (mixed-type keys) hash
+    their repr instead.
+    """
+    try:
+        encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    except TypeError:
+        encoded = str(data)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def _extract_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a record's alias keys to work order fields, preferring earlier aliases"""
+    fields = {}
+    ranks = {}
+    for key, value in data.items():
+        alias = _ALIAS_FIELDS.get(key)
+        if alias is not None:
+            field, rank = alias
+            if rank < ranks.get(field, rank + 1):
+                ranks[field] = rank
+                fields[field] = value
+    return fields
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkOrder:
     """Work order data structure"""
     id: str
@@ -89,83 +273,222 @@ class WorkOrder:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['status'] = self.status.value
-        data['priority'] = self.priority.value
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        if self.due_date:
-            data['due_date'] = self.due_date.isoformat()
-        return data
+        # Built directly rather than via asdict(), which deep-copies every field
+        # only for status, priority and the timestamps to be overwritten
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'status': _STATUS_VALUES[self.status],
+            'priority': _PRIORITY_VALUES[self.priority],
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'assigned_to': self.assigned_to,
+            'due_date': self.due_date.isoformat() if self.due_date else self.due_date,
+            'tags': list(self.tags),
+            'metadata': dict(self.metadata),
+            'source': self.source,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WorkOrder':
         """Create from dictionary"""
-        data['status'] = WorkOrderStatus(data['status'])
-        data['priority'] = WorkOrderPriority(data['priority'])
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+        # Unknown values fall through to the Enum constructor so they still raise ValueError
+        status = data['status']
+        data['status'] = _STATUS_BY_VALUE.get(status) or WorkOrderStatus(status)
+        priority = data['priority']
+        data['priority'] = _PRIORITY_BY_VALUE.get(priority) or WorkOrderPriority(priority)
+        
+        fromisoformat = datetime.fromisoformat
+        data['created_at'] = fromisoformat(data['created_at'])
+        data['updated_at'] = fromisoformat(data['updated_at'])
         if data.get('due_date'):
-            data['due_date'] = datetime.fromisoformat(data['due_date'])
+            data['due_date'] = fromisoformat(data['due_date'])
         return cls(**data)
 
 
+class _IndexedKeys(NamedTuple):
+    """Keys a work order was indexed under, as they were when it was indexed"""
+    status: WorkOrderStatus
+    priority: WorkOrderPriority
+    assigned_to: Optional[str]
+    tags: Tuple[str, ...]
+    words: Tuple[str, ...]
+
+
 class WorkOrderIndex:
-    """Work order indexing and search system"""
+    """
+    Work order indexing and search system.
+    
+    Every id held by a secondary index is a key of work_orders; _index_work_order
+    and _unindex_work_order keep them in sync, so lookups need no extra guard.
+    Work orders are mutable, so each one's index keys are recorded when it is
+    indexed and removal works from that record rather than the current fields.
+    """
     
     def __init__(self):
         self.work_orders: Dict[str, WorkOrder] = {}
-        self.index_by_status: Dict[WorkOrderStatus, List[str]] = {}
-        self.index_by_priority: Dict[WorkOrderPriority, List[str]] = {}
-        self.index_by_assigned: Dict[str, List[str]] = {}
-        self.index_by_tags: Dict[str, List[str]] = {}
-        self.search_index: Dict[str, List[str]] = {}
+        # Secondary indexes map keys to insertion-ordered id sets (dicts with None values)
+        self.index_by_status: Dict[WorkOrderStatus, Dict[str, None]] = {}
+        self.index_by_priority: Dict[WorkOrderPriority, Dict[str, None]] = {}
+        self.index_by_assigned: Dict[str, Dict[str, None]] = {}
+        self.index_by_tags: Dict[str, Dict[str, None]] = {}
+        self.search_index: Dict[str, Set[str]] = {}
+        self._indexed_keys: Dict[str, _IndexedKeys] = {}
+        
+        # Search results keyed by query words, tagged with the index version they were computed at
+        self._index_version = 0
+        self._search_cache: "OrderedDict[Tuple[str, ...], Tuple[int, Tuple[str, ...]]]" = OrderedDict()
         
         # Initialize index structures
         for status in WorkOrderStatus:
-            self.index_by_status[status] = []
+            self.index_by_status[status] = {}
         for priority in WorkOrderPriority:
-            self.index_by_priority[priority] = []
+            self.index_by_priority[priority] = {}
     
     def add_work_order(self, work_order: WorkOrder) -> None:
         """Add a work order to the index"""
-        self.work_orders[work_order.id] = work_order
+        self._index_work_order(work_order)
+        
+        logger.info("Work order added to index", 
+                   work_order_id=work_order.id, 
+                   status=work_order.status.value)
+    
+    def add_work_orders(self, work_orders: Iterable[WorkOrder]) -> int:
+        """Add a batch of work orders to the index, logging once for the batch"""
+        count = 0
+        for work_order in work_orders:
+            self._index_work_order(work_order)
+            count += 1
+        
+        logger.info("Work orders added to index", count=count)
+        return count
+    
+    def update_status(self, work_order_id: str, status: WorkOrderStatus) -> bool:
+        """Move an indexed work order to a new status; returns False if the id is unknown"""
+        work_order = self.work_orders.get(work_order_id)
+        if work_order is None:
+            return False
+        
+        keys = self._indexed_keys[work_order_id]
+        if keys.status is not status:
+            self.index_by_status[keys.status].pop(work_order_id, None)
+            self.index_by_status[status][work_order_id] = None
+            self._indexed_keys[work_order_id] = keys._replace(status=status)
+        work_order.status = status
+        
+        logger.info("Work order status updated", work_order_id=work_order_id, status=status.value)
+        return True
+    
+    def remove_work_order(self, work_order_id: str) -> Optional[WorkOrder]:
+        """Remove a work order and its secondary index entries"""
+        work_order = self.work_orders.pop(work_order_id, None)
+        if work_order is None:
+            return None
+        
+        self._unindex_work_order(work_order_id)
+        
+        logger.info("Work order removed from index", work_order_id=work_order_id)
+        return work_order
+    
+    def _unindex_work_order(self, work_order_id: str) -> None:
+        """Drop a work order's entries from all secondary indexes, using the keys it was indexed under"""
+        keys = self._indexed_keys.pop(work_order_id)
+        self._index_version += 1
+        self.index_by_status[keys.status].pop(work_order_id, None)
+        self.index_by_priority[keys.priority].pop(work_order_id, None)
+        
+        if keys.assigned_to:
+            self._discard(self.index_by_assigned, keys.assigned_to, work_order_id)
+        
+        for tag in keys.tags:
+            self._discard(self.index_by_tags, tag, work_order_id)
+        
+        search_index = self.search_index
+        for word in keys.words:
+            ids = search_index.get(word)
+            if ids is not None:
+                ids.discard(work_order_id)
+                if not ids:
+                    del search_index[word]
+    
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, None]], key: str, work_order_id: str) -> None:
+        """Drop an id from a keyed index, removing the key once it has no ids left"""
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(work_order_id, None)
+            if not ids:
+                del index[key]
+    
+    def _index_work_order(self, work_order: WorkOrder) -> None:
+        """Store a work order and update all secondary indexes"""
+        # The id is a key in every index; interning it lets all of them share one string.
+        # Ids from JSON APIs are not always strings, and only strings can be interned
+        work_order_id = work_order.id
+        if type(work_order_id) is str:
+            work_order.id = work_order_id = sys.intern(work_order_id)
+        
+        # Re-indexing an id replaces the previous version rather than leaving stale entries
+        if work_order_id in self._indexed_keys:
+            self._unindex_work_order(work_order_id)
+        
+        self.work_orders[work_order_id] = work_order
+        self._index_version += 1
         
         # Update status index
-        self.index_by_status[work_order.status].append(work_order.id)
+        self.index_by_status[work_order.status][work_order_id] = None
         
         # Update priority index
-        self.index_by_priority[work_order.priority].append(work_order.id)
+        self.index_by_priority[work_order.priority][work_order_id] = None
         
         # Update assigned index
         if work_order.assigned_to:
-            if work_order.assigned_to not in self.index_by_assigned:
-                self.index_by_assigned[work_order.assigned_to] = []
-            self.index_by_assigned[work_order.assigned_to].append(work_order.id)
+            if type(work_order.assigned_to) is str:
+                work_order.assigned_to = sys.intern(work_order.assigned_to)
+            self.index_by_assigned.setdefault(work_order.assigned_to, {})[work_order_id] = None
         
-        # Update tags index
+        # Update tags index; tags repeat across work orders, so intern them to share one string each
+        index_by_tags = self.index_by_tags
+        if work_order.tags:
+            work_order.tags = [sys.intern(tag) if type(tag) is str else tag for tag in work_order.tags]
         for tag in work_order.tags:
-            if tag not in self.index_by_tags:
-                self.index_by_tags[tag] = []
-            self.index_by_tags[tag].append(work_order.id)
+            index_by_tags.setdefault(tag, {})[work_order_id] = None
         
         # Update search index
-        self._update_search_index(work_order)
+        words = self._update_search_index(work_order)
         
-        logger.info("Work order added to index", 
-                   work_order_id=work_order.id, 
-                   status=work_order.status.value)
+        self._indexed_keys[work_order_id] = _IndexedKeys(
+            work_order.status, work_order.priority, work_order.assigned_to, tuple(work_order.tags), words
+        )
     
-    def _update_search_index(self, work_order: WorkOrder) -> None:
-        """Update the search index for a work order"""
-        searchable_text = f"{work_order.title} {work_order.description} {' '.join(work_order.tags)}"
-        words = re.findall(r'\b\w+\b', searchable_text.lower())
+    @staticmethod
+    def _search_words(work_order: WorkOrder) -> Iterable[str]:
+        """Distinct indexable words of a work order, at most SEARCH_MAX_WORDS_PER_WORK_ORDER of them"""
+        # Title and tags come first, so a capped description never pushes them out
+        searchable_text = f"{work_order.title} {' '.join(work_order.tags)} {work_order.description}"
+        tokens = _tokenize(searchable_text)
+        words = set(tokens)
+        words -= SEARCH_STOPWORDS
+        if len(words) <= SEARCH_MAX_WORDS_PER_WORK_ORDER:
+            return words
         
+        # Over the cap, keep the first distinct words in document order
+        words = dict.fromkeys(token for token in tokens if token not in SEARCH_STOPWORDS)
+        return list(itertools.islice(words, SEARCH_MAX_WORDS_PER_WORK_ORDER))
+    
+    def _update_search_index(self, work_order: WorkOrder) -> Tuple[str, ...]:
+        """Update the search index for a work order, returning the words it was indexed under"""
+        search_index = self.search_index
+        work_order_id = work_order.id
+        words = tuple(self._search_words(work_order))
         for word in words:
-            if word not in self.search_index:
-                self.search_index[word] = []
-            if work_order.id not in self.search_index[word]:
-                self.search_index[word].append(work_order.id)
+            ids = search_index.get(word)
+            if ids is None:
+                # New vocabulary words are interned so query lookups hit the identity fast path
+                ids = search_index[sys.intern(word)] = set()
+            ids.add(work_order_id)
+        return words
     
     def get_work_order(self, work_order_id: str) -> Optional[WorkOrder]:
         """Get a work order by ID"""
@@ -173,37 +496,68 @@ class WorkOrderIndex:
     
     def search_work_orders(self, query: str) -> List[WorkOrder]:
         """Search work orders by text query"""
-        query_words = re.findall(r'\b\w+\b', query.lower())
-        matching_ids = set()
+        return list(map(self.work_orders.__getitem__, self.search_ids(query)))
+    
+    def search_ids(self, query: str) -> Tuple[str, ...]:
+        """Search work order ids by text query without materializing the work orders"""
+        # Matching is an AND over distinct words, so word order and repeats do not change the result
+        query_words = tuple(sorted(set(_tokenize(query))))
         
-        for word in query_words:
-            if word in self.search_index:
-                if not matching_ids:
-                    matching_ids = set(self.search_index[word])
-                else:
-                    matching_ids &= set(self.search_index[word])
+        search_cache = self._search_cache
+        cached = search_cache.get(query_words)
+        if cached is not None and cached[0] == self._index_version:
+            search_cache.move_to_end(query_words)
+            matching_ids = cached[1]
+        else:
+            # Words that are not indexed (including stopwords) do not narrow the results
+            postings = [self.search_index[word] for word in query_words if word in self.search_index]
+            if postings:
+                # Seed from the shortest posting set so the work is bounded by the rarest word,
+                # and stop as soon as no candidates are left
+                postings.sort(key=len)
+                candidates = postings[0]
+                for posting in postings[1:]:
+                    candidates = candidates & posting
+                    if not candidates:
+                        break
+                matching_ids = tuple(candidates)
+            else:
+                matching_ids = ()
+            
+            search_cache[query_words] = (self._index_version, matching_ids)
+            search_cache.move_to_end(query_words)
+            if len(search_cache) > SEARCH_CACHE_SIZE:
+                search_cache.popitem(last=False)
         
-        return [self.work_orders[wo_id] for wo_id in matching_ids if wo_id in self.work_orders]
+        return matching_ids
     
     def get_work_orders_by_status(self, status: WorkOrderStatus) -> List[WorkOrder]:
         """Get work orders by status"""
-        return [self.work_orders[wo_id] for wo_id in self.index_by_status[status] 
-                if wo_id in self.work_orders]
+        return list(map(self.work_orders.__getitem__, self.index_by_status[status]))
+    
+    def iter_work_orders_by_status(self, status: WorkOrderStatus) -> Iterator[WorkOrder]:
+        """Iterate work orders by status without building a list; do not modify the index meanwhile"""
+        return map(self.work_orders.__getitem__, self.index_by_status[status])
+    
+    def count_work_orders_by_status(self, status: WorkOrderStatus) -> int:
+        """Count work orders by status"""
+        return len(self.index_by_status[status])
     
     def get_work_orders_by_priority(self, priority: WorkOrderPriority) -> List[WorkOrder]:
         """Get work orders by priority"""
-        return [self.work_orders[wo_id] for wo_id in self.index_by_priority[priority] 
-                if wo_id in self.work_orders]
+        return list(map(self.work_orders.__getitem__, self.index_by_priority[priority]))
+    
+    def count_work_orders_by_priority(self, priority: WorkOrderPriority) -> int:
+        """Count work orders by priority"""
+        return len(self.index_by_priority[priority])
     
     def get_work_orders_by_assigned(self, assigned_to: str) -> List[WorkOrder]:
         """Get work orders by assignee"""
-        wo_ids = self.index_by_assigned.get(assigned_to, [])
-        return [self.work_orders[wo_id] for wo_id in wo_ids if wo_id in self.work_orders]
+        return list(map(self.work_orders.__getitem__, self.index_by_assigned.get(assigned_to, ())))
     
     def get_work_orders_by_tag(self, tag: str) -> List[WorkOrder]:
         """Get work orders by tag"""
-        wo_ids = self.index_by_tags.get(tag, [])
-        return [self.work_orders[wo_id] for wo_id in wo_ids if wo_id in self.work_orders]
+        return list(map(self.work_orders.__getitem__, self.index_by_tags.get(tag, ())))
     
     def get_queued_work_orders(self) -> List[WorkOrder]:
         """Get all queued work orders"""
@@ -224,24 +578,67 @@ class WorkOrderIndex:
             "search_index_size": len(self.search_index)
         }
     
-    def export_to_json(self) -> str:
-        """Export work orders to JSON"""
-        data = {
+    def _export_data(self) -> Dict[str, Any]:
+        """Build the export payload"""
+        return {
             "work_orders": [wo.to_dict() for wo in self.work_orders.values()],
             "statistics": self.get_statistics(),
             "exported_at": datetime.now().isoformat()
         }
-        return json.dumps(data, indent=2)
     
-    def import_from_json(self, json_data: str) -> None:
+    def export_to_json(self) -> str:
+        """Export work orders to JSON"""
+        return self.export_to_json_bytes().decode('utf-8')
+    
+    def export_to_json_bytes(self) -> bytes:
+        """Export work orders to JSON encoded as UTF-8 bytes"""
+        return fastjson.dumps(self._export_data(), pretty=True)
+    
+    def export_to_file(self, filepath: str) -> None:
+        """
+        Stream the JSON export to a file.
+        
+        Work orders are serialized one at a time, each on its own line, so only
+        a single work order's dict is alive at once instead of the whole export.
+        The many small pieces go through a buffered binary file rather than
+        fastjson.write_bytes, which suits documents already serialized whole.
+        """
+        dumps = fastjson.dumps
+        with open(filepath, 'wb') as f:
+            f.write(b'{"work_orders": [')
+            separator = b'\n'
+            for wo in self.work_orders.values():
+                f.write(separator)
+                f.write(dumps(wo.to_dict()))
+                separator = b',\n'
+            f.write(b'\n],\n"statistics": ')
+            f.write(dumps(self.get_statistics()))
+            f.write(b',\n"exported_at": ')
+            f.write(dumps(datetime.now().isoformat()))
+            f.write(b'}\n')
+    
+    def iter_ndjson_lines(self) -> Iterable[bytes]:
+        """Yield the export as NDJSON lines: a header record, then one work order per line"""
+        yield fastjson.dumps({"schema": NDJSON_SCHEMA, "count": len(self.work_orders)}) + b"\n"
+        for wo in self.work_orders.values():
+            yield fastjson.dumps(wo.to_dict()) + b"\n"
+    
+    def import_from_ndjson(self, lines: Iterable[bytes]) -> int:
+        """Import work orders from NDJSON lines following the header record"""
+        count = self.add_work_orders(
+            WorkOrder.from_dict(fastjson.loads(line)) for line in lines if line.strip()
+        )
+        logger.info("Work orders imported from NDJSON", count=count)
+        return count
+    
+    def import_from_json(self, json_data: Union[str, bytes]) -> None:
         """Import work orders from JSON"""
-        data = json.loads(json_data)
+        data = fastjson.loads(json_data)
         
-        for wo_data in data.get("work_orders", []):
-            work_order = WorkOrder.from_dict(wo_data)
-            self.add_work_order(work_order)
+        from_dict = WorkOrder.from_dict
+        count = self.add_work_orders(from_dict(wo_data) for wo_data in data.get("work_orders", ()))
         
-        logger.info("Work orders imported from JSON", count=len(data.get("work_orders", [])))
+        logger.info("Work orders imported from JSON", count=count)
 
 
 class WorkOrderDiscovery:
@@ -249,8 +646,8 @@ class WorkOrderDiscovery:
     
     def __init__(self, base_url: str = "https://factory.8090.ai"):
         self.base_url = base_url
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.browser: Optional["Browser"] = None
+        self.page: Optional["Page"] = None
         self.session: Optional[httpx.AsyncClient] = None
     
     async def __aenter__(self):
@@ -277,6 +674,7 @@ class WorkOrderDiscovery:
         )
         
         # Initialize browser automation
+        from playwright.async_api import async_playwright
         playwright = await async_playwright().start()
         self.browser = await playwright.chromium.launch(headless=True)
         self.page = await self.browser.new_page()
@@ -294,23 +692,28 @@ class WorkOrderDiscovery:
             await self.browser.close()
         logger.info("Work order discovery closed")
     
-    async def _setup_request_interception(self):
+    async def _setup_request_interception(self, page: Optional["Page"] = None):
         """Set up request interception to capture work order data"""
-        if not self.page:
+        page = page or self.page
+        if not page:
             return
         
         async def handle_response(response):
             """Handle intercepted responses for work order data"""
-            if response.url.startswith(self.base_url):
-                try:
-                    content_type = response.headers.get("content-type", "")
-                    if "application/json" in content_type:
-                        data = await response.json()
-                        await self._process_api_response(response.url, data)
-                except Exception as e:
-                    logger.debug("Failed to process response", url=response.url, error=str(e))
+            # Only successful JSON responses from the service are read, so every other
+            # intercepted response returns before its body is fetched
+            if not response.url.startswith(self.base_url) or not response.ok:
+                return
+            if "application/json" not in response.headers.get("content-type", ""):
+                return
+            try:
+                data = fastjson.loads(await response.body())
+                await self._process_api_response(response.url, data)
+            except Exception as e:
+                logger.debug("Failed to process response", url=response.url, error=str(e))
         
-        await self.page.on("response", handle_response)
+        # Page.on registers the listener synchronously and returns None, so it is not awaited
+        page.on("response", handle_response)
     
     async def _process_api_response(self, url: str, data: Any) -> None:
         """Process API response for work order data"""
@@ -328,14 +731,14 @@ class WorkOrderDiscovery:
         """Extract work orders from dictionary data"""
         work_orders = []
         
-        # Look for common work order patterns
-        work_order_patterns = [
-            "work_orders", "workOrders", "tasks", "jobs", "orders",
-            "queue", "pending", "assigned", "work_items"
-        ]
+        # Most intercepted payloads carry none of the keys, so one set intersection rules them out;
+        # matches are still visited in _WORK_ORDER_KEYS order to keep the output deterministic
+        matched = data.keys() & _WORK_ORDER_KEY_SET
+        if not matched:
+            return work_orders
         
-        for pattern in work_order_patterns:
-            if pattern in data:
+        for pattern in _WORK_ORDER_KEYS:
+            if pattern in matched:
                 items = data[pattern]
                 if isinstance(items, list):
                     for item in items:
@@ -348,64 +751,39 @@ class WorkOrderDiscovery:
     async def _create_work_order_from_data(self, data: Dict[str, Any], source_url: str) -> Optional[WorkOrder]:
         """Create a work order from data dictionary"""
         try:
+            fields = _extract_fields(data)
+            
             # Extract basic fields
-            wo_id = str(data.get("id", data.get("_id", data.get("work_order_id", ""))))
+            wo_id = str(fields.get("id", ""))
             if not wo_id:
-                wo_id = hashlib.md5(str(data).encode()).hexdigest()[:12]
-            
-            title = data.get("title", data.get("name", data.get("subject", "Untitled Work Order")))
-            description = data.get("description", data.get("details", data.get("summary", "")))
+                wo_id = _fallback_id(data)
             
-            # Extract status
-            status_str = data.get("status", data.get("state", "queued")).lower()
-            status_mapping = {
-                "queued": WorkOrderStatus.QUEUED,
-                "pending": WorkOrderStatus.QUEUED,
-                "in_progress": WorkOrderStatus.IN_PROGRESS,
-                "active": WorkOrderStatus.IN_PROGRESS,
-                "completed": WorkOrderStatus.COMPLETED,
-                "done": WorkOrderStatus.COMPLETED,
-                "failed": WorkOrderStatus.FAILED,
-                "error": WorkOrderStatus.FAILED,
-                "cancelled": WorkOrderStatus.CANCELLED,
-                "cancelled": WorkOrderStatus.CANCELLED,
-                "on_hold": WorkOrderStatus.ON_HOLD,
-                "paused": WorkOrderStatus.ON_HOLD
-            }
-            status = status_mapping.get(status_str, WorkOrderStatus.QUEUED)
+            title = fields.get("title", "Untitled Work Order")
+            description = fields.get("description", "")
             
-            # Extract priority
-            priority_str = data.get("priority", data.get("urgency", "medium")).lower()
-            priority_mapping = {
-                "low": WorkOrderPriority.LOW,
-                "medium": WorkOrderPriority.MEDIUM,
-                "high": WorkOrderPriority.HIGH,
-                "urgent": WorkOrderPriority.URGENT,
-                "critical": WorkOrderPriority.CRITICAL
-            }
-            priority = priority_mapping.get(priority_str, WorkOrderPriority.MEDIUM)
+            # Extract status and priority
+            status = _STATUS_ALIASES.get(fields.get("status", "queued").casefold(), WorkOrderStatus.QUEUED)
+            priority = _PRIORITY_ALIASES.get(fields.get("priority", "medium").casefold(), WorkOrderPriority.MEDIUM)
             
             # Extract timestamps
-            created_at = self._parse_timestamp(data.get("created_at", data.get("created", data.get("timestamp"))))
-            updated_at = self._parse_timestamp(data.get("updated_at", data.get("updated", data.get("modified"))))
-            due_date = self._parse_timestamp(data.get("due_date", data.get("deadline", data.get("due"))))
+            created_at = self._parse_timestamp(fields.get("created_at"))
+            updated_at = self._parse_timestamp(fields.get("updated_at"))
+            due_date = self._parse_timestamp(fields.get("due_date"))
             
             # Extract assignee
-            assigned_to = data.get("assigned_to", data.get("assignee", data.get("owner")))
+            assigned_to = fields.get("assigned_to")
             if assigned_to and isinstance(assigned_to, dict):
                 assigned_to = assigned_to.get("name", assigned_to.get("email", str(assigned_to)))
             
             # Extract tags
-            tags = data.get("tags", data.get("labels", data.get("categories", [])))
+            tags = fields.get("tags", [])
             if isinstance(tags, str):
                 tags = [tag.strip() for tag in tags.split(",")]
             elif not isinstance(tags, list):
                 tags = []
             
             # Extract metadata
-            metadata = {k: v for k, v in data.items() 
-                       if k not in ["id", "title", "description", "status", "priority", 
-                                  "created_at", "updated_at", "due_date", "assigned_to", "tags"]}
+            metadata = {k: v for k, v in data.items() if k not in _METADATA_SKIP_KEYS}
             metadata["source_url"] = source_url
             
             work_order = WorkOrder(
@@ -442,20 +820,10 @@ class WorkOrderDiscovery:
             return datetime.fromtimestamp(timestamp)
         
         if isinstance(timestamp, str):
-            # Try various ISO formats
-            formats = [
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d"
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(timestamp, fmt)
-                except ValueError:
-                    continue
+            # One regex match replaces a sweep of strptime formats, each raising on a miss
+            parsed = _parse_timestamp_string(timestamp)
+            if parsed is not None:
+                return parsed
             
             # Try parsing with dateutil if available
             try:
@@ -487,25 +855,18 @@ class WorkOrderDiscovery:
             page_work_orders = await self._extract_work_orders_from_page()
             work_orders.extend(page_work_orders)
             
-            # Try to find and click on work order related elements
+            # Find work order related links and open each in its own page concurrently,
+            # rather than clicking through them and navigating back one at a time
             work_order_links = await self.page.query_selector_all("a[href*='work'], a[href*='order'], a[href*='task'], a[href*='job']")
             
+            link_urls = []
             for link in work_order_links[:5]:  # Limit to first 5 links
-                try:
-                    await link.click()
-                    await self.page.wait_for_load_state("networkidle")
-                    
-                    # Extract work orders from the new page
-                    page_work_orders = await self._extract_work_orders_from_page()
-                    work_orders.extend(page_work_orders)
-                    
-                    # Go back
-                    await self.page.go_back()
-                    await self.page.wait_for_load_state("networkidle")
-                    
-                except Exception as e:
-                    logger.debug("Failed to process work order link", error=str(e))
-                    continue
+                href = await link.get_attribute("href")
+                if href:
+                    link_urls.append(urljoin(self.page.url, href))
+            
+            for page_work_orders in await asyncio.gather(*[self._extract_work_orders_from_link(url) for url in link_urls]):
+                work_orders.extend(page_work_orders)
             
             # Look for API endpoints that might contain work order data
             api_work_orders = await self._discover_work_orders_from_apis()
@@ -517,13 +878,31 @@ class WorkOrderDiscovery:
         logger.info("Work order discovery completed", count=len(work_orders))
         return work_orders
     
-    async def _extract_work_orders_from_page(self) -> List[WorkOrder]:
-        """Extract work orders from the current page"""
+    async def _extract_work_orders_from_link(self, url: str) -> List[WorkOrder]:
+        """Open a link in a new page of the session, with responses intercepted, and extract its work orders"""
+        page = None
+        try:
+            # Open the page in the main page's context so it shares its cookies, auth and storage
+            page = await self.page.context.new_page()
+            await self._setup_request_interception(page)
+            await page.goto(url)
+            await page.wait_for_load_state("networkidle")
+            return await self._extract_work_orders_from_page(page)
+        except Exception as e:
+            logger.debug("Failed to process work order link", url=url, error=str(e))
+            return []
+        finally:
+            if page is not None:
+                await page.close()
+    
+    async def _extract_work_orders_from_page(self, page: Optional["Page"] = None) -> List[WorkOrder]:
+        """Extract work orders from the current page, or from the given page"""
+        page = page or self.page
         work_orders = []
         
         try:
             # Look for work order data in JavaScript variables
-            js_data = await self.page.evaluate("""
+            js_data = await page.evaluate("""
                 () => {
                     const data = {};
                     
@@ -550,7 +929,7 @@ class WorkOrderDiscovery:
             """)
             
             if js_data:
-                work_orders = await self._extract_work_orders_from_dict(js_data, self.page.url)
+                work_orders = await self._extract_work_orders_from_dict(js_data, page.url)
             
         except Exception as e:
             logger.debug("Failed to extract work orders from page", error=str(e))
@@ -580,16 +959,30 @@ class WorkOrderDiscovery:
             "/api/v2/jobs"
         ]
         
-        for endpoint in api_endpoints:
-            try:
-                response = await self.session.get(endpoint)
-                if response.status_code == 200:
-                    data = response.json()
-                    endpoint_work_orders = await self._extract_work_orders_from_dict(data, endpoint)
-                    work_orders.extend(endpoint_work_orders)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
+        
+        async def _fetch(endpoint: str) -> List[WorkOrder]:
+            """Fetch one endpoint and extract its work orders, returning none on failure"""
+            async with semaphore:
+                try:
+                    response = await self.session.get(endpoint)
+                    if response.status_code == 200:
+                        data = fastjson.loads(response.content)
+                        if isinstance(data, dict):
+                            return await self._extract_work_orders_from_dict(data, endpoint)
                     
-            except Exception as e:
-                logger.debug("Failed to fetch from API endpoint", endpoint=endpoint, error=str(e))
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.debug("Failed to fetch from API endpoint", endpoint=endpoint, error=str(e))
+            return []
+        
+        # The endpoints are independent, so probe them concurrently; gather keeps endpoint order,
+        # and return_exceptions keeps an unexpected error at one endpoint from discarding the others' results
+        results = await asyncio.gather(*[_fetch(endpoint) for endpoint in api_endpoints], return_exceptions=True)
+        for endpoint, result in zip(api_endpoints, results):
+            if isinstance(result, BaseException):
+                logger.error("Unexpected error fetching from API endpoint", endpoint=endpoint, error=repr(result))
+            else:
+                work_orders.extend(result)
         
         return work_orders
 
@@ -607,7 +1000,7 @@ class WorkOrderIndexer:
         """Index all work orders from 8090 integrations"""
         logger.info("Starting work order indexing")
         
-        start_time = datetime.now()
+        start = time.perf_counter()
         
         try:
             async with self.discovery as discovery:
@@ -615,15 +1008,14 @@ class WorkOrderIndexer:
                 work_orders = await discovery.discover_work_orders()
                 
                 # Add to index
-                for work_order in work_orders:
-                    self.index.add_work_order(work_order)
+                self.index.add_work_orders(work_orders)
                 
                 # Update last index time
                 self.last_index_time = datetime.now()
                 
                 # Generate statistics
                 stats = self.index.get_statistics()
-                stats["indexing_duration"] = (self.last_index_time - start_time).total_seconds()
+                stats["indexing_duration"] = time.perf_counter() - start
                 stats["discovered_count"] = len(work_orders)
                 stats["indexed_count"] = len(self.index.work_orders)
                 
@@ -642,6 +1034,10 @@ class WorkOrderIndexer:
         """Search work orders"""
         return self.index.search_work_orders(query)
     
+    def search_work_order_ids(self, query: str) -> Tuple[str, ...]:
+        """Search work order ids, for callers that only need to count or reference matches"""
+        return self.index.search_ids(query)
+    
     def get_work_order_statistics(self) -> Dict[str, Any]:
         """Get work order statistics"""
         stats = self.index.get_statistics()
@@ -649,17 +1045,57 @@ class WorkOrderIndexer:
         return stats
     
     def export_work_orders(self, filepath: str) -> None:
-        """Export work orders to JSON file"""
-        json_data = self.index.export_to_json()
-        with open(filepath, 'w') as f:
-            f.write(json_data)
+        """
+        Export work orders to JSON file.
+        
+        The export is streamed one work order at a time, so the full document
+        is never built in memory. Paths ending in .ndjson or .jsonl are written
+        as NDJSON, one work order per line after a header record.
+        """
+        if filepath.endswith(NDJSON_SUFFIXES):
+            with open(filepath, 'wb') as f:
+                f.writelines(self.index.iter_ndjson_lines())
+        else:
+            self.index.export_to_file(filepath)
         logger.info("Work orders exported", filepath=filepath)
     
+    @staticmethod
+    def _read_ndjson_header(f) -> bool:
+        """Consume the NDJSON header record from a binary file, if it has one"""
+        # Peek at a short prefix first so a single-line JSON export is never read whole
+        if f.read(9) != b'{"schema"':
+            return False
+        f.seek(0)
+        try:
+            return fastjson.loads(f.readline()).get("schema") == NDJSON_SCHEMA
+        except ValueError:
+            return False
+    
     def import_work_orders(self, filepath: str) -> None:
-        """Import work orders from JSON file"""
-        with open(filepath, 'r') as f:
-            json_data = f.read()
-        self.index.import_from_json(json_data)
+        """
+        Import work orders from JSON file.
+        
+        NDJSON exports are recognised by their header record and read line by
+        line. For JSON exports with ijson installed the work_orders array is
+        parsed incrementally, so each work order is indexed as it is read
+        instead of loading the whole export into memory first.
+        """
+        with open(filepath, 'rb') as f:
+            if self._read_ndjson_header(f):
+                self.index.import_from_ndjson(f)
+                logger.info("Work orders imported", filepath=filepath)
+                return
+        
+        if ijson is None:
+            with open(filepath, 'rb') as f:
+                json_data = f.read()
+            self.index.import_from_json(json_data)
+        else:
+            with open(filepath, 'rb') as f:
+                items = ijson.items(f, 'work_orders.item', use_float=True)
+                count = self.index.add_work_orders(WorkOrder.from_dict(wo_data) for wo_data in items)
+            logger.info("Work orders imported from JSON", count=count)
+        
         logger.info("Work orders imported", filepath=filepath)
 
 
@@ -674,13 +1110,14 @@ async def main():
         stats = await indexer.index_work_orders()
         
         print(f"✅ Work order indexing completed!")
-        print(f"📊 Statistics: {json.dumps(stats, indent=2)}")
+        print(f"📊 Statistics: {fastjson.dumps(stats, pretty=True).decode('utf-8')}")
         
         # Get queued work orders
-        queued_orders = indexer.get_queued_work_orders()
-        print(f"\n📋 Queued work orders: {len(queued_orders)}")
+        queued_count = indexer.index.count_work_orders_by_status(WorkOrderStatus.QUEUED)
+        print(f"\n📋 Queued work orders: {queued_count}")
         
-        for order in queued_orders[:5]:  # Show first 5
+        queued_orders = indexer.index.iter_work_orders_by_status(WorkOrderStatus.QUEUED)
+        for order in itertools.islice(queued_orders, 5):  # Show first 5
             print(f"  - {order.title} ({order.status.value}) - {order.priority.value}")
         
         # Export results